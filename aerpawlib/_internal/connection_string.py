@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from urllib.parse import urlparse
 
+_IPV6_NETLOC_RE = re.compile(r"\[([^\]]+)\]:(\d+)$")
+
 
 def parse_udp_connection_port(connection_string: str) -> tuple[str, int] | None:
     """Parse host and port from a UDP listen connection string.
@@ -25,7 +27,7 @@ def parse_udp_connection_port(connection_string: str) -> tuple[str, int] | None:
     if not netloc:
         return None
 
-    ipv6_match = re.match(r"\[([^\]]+)\]:(\d+)$", netloc)
+    ipv6_match = _IPV6_NETLOC_RE.match(netloc)
     if ipv6_match:
         host, port_str = ipv6_match.group(1), ipv6_match.group(2)
     else:
@@ -7,6 +7,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import re
+from collections.abc import AsyncIterator
 from re import Pattern
 
 
@@ -123,6 +124,19 @@ class ExternalProcess:
             return None
         return out.decode("ascii").rstrip()
 
+    async def read_lines(self) -> AsyncIterator[str]:
+        """
+        Iterate over stdout lines until the process closes stdout.
+
+        Yields:
+            str: Each line, decoded the same way as `read_line`.
+        """
+        while True:
+            line = await self.read_line()
+            if line is None:
+                return
+            yield line
+
     async def send_input(self, data: str) -> None:
         """
         Send a string to the process's stdin.
@@ -164,10 +178,11 @@ class ExternalProcess:
                 is unavailable before a match is found.
         """
         buff = []
+        search = re.compile(output_regex).search
         while True:
             out = await self.read_line()
             if out is None:
                 return buff
             buff.append(out)
-            if re.search(output_regex, out):
+            if search(out):
                 return buff
@@ -250,15 +250,22 @@ class StateMachine(Runner):
 
             async def _task_runner(t: _BackgroundTask = task) -> None:
                 """Run and automatically restart a background task on failure."""
+                consecutive_failures = 0
                 while self._running:
                     try:
                         await t.__func__(self, vehicle)
+                        consecutive_failures = 0
+                        continue
                     except asyncio.CancelledError:
                         return
                     except Exception as e:
+                        consecutive_failures += 1
                         logger.error(f"Background task {t.__name__} failed: {e}")
                         traceback.print_exc()
-                        await asyncio.sleep(0.5)
+                    # Back off exponentially so a persistently failing task does
+                    # not spin. Sleep outside the except block so the traceback
+                    # frames are released before the retry delay.
+                    await asyncio.sleep(min(0.5 * (2 ** (consecutive_failures - 1)), 30))
 
             future = asyncio.ensure_future(_task_runner())
             self._background_task_futures.append(future)
@@ -298,35 +305,39 @@ class StateMachine(Runner):
 
         await self._start_background_tasks(vehicle)
 
-        while self._running:
-            if self._current_state not in self._states:
-                raise InvalidStateError(self._current_state, list(self._states.keys()))
+        from aerpawlib.cli.progress_bar import update_progress
 
-            from aerpawlib.cli.progress_bar import update_progress
+        try:
+            while self._running:
+                if self._current_state not in self._states:
+                    raise InvalidStateError(self._current_state, list(self._states.keys()))
 
-            update_progress(
-                f"Running state: {self._current_state}",
-                completed=70,
-                state=self._current_state,
-            )
+                update_progress(
+                    f"Running state: {self._current_state}",
+                    completed=70,
+                    state=self._current_state,
+                )
 
-            next_state = await self._states[self._current_state].run(self, vehicle)
-            if self._next_state_overrides:
-                self._current_state = self._next_state_overrides.pop(0)
-                logger.info(f"StateMachine: state transition (override) -> '{self._current_state}'")
-            else:
-                self._current_state = next_state
+                next_state = await self._states[self._current_state].run(self, vehicle)
+                if self._next_state_overrides:
+                    self._current_state = self._next_state_overrides.pop(0)
+                    logger.info(f"StateMachine: state transition (override) -> '{self._current_state}'")
+                else:
+                    self._current_state = next_state
 
-            if self._current_state is None:
-                self.stop()
-            await asyncio.sleep(STATE_MACHINE_DELAY_S)
-        self._running = False
-        for future in self._background_task_futures:
-            future.cancel()
-        if self._background_task_futures:
-            await asyncio.gather(*self._background_task_futures, return_exceptions=True)
+                if self._current_state is None:
+                    self.stop()
+                await asyncio.sleep(STATE_MACHINE_DELAY_S)
+        finally:
+            # Cancel and drain background tasks before cleanup() on every exit
+            # path, including a failing state.
+            self._running = False
+            for future in self._background_task_futures:
+                future.cancel()
+            if self._background_task_futures:
+                await asyncio.gather(*self._background_task_futures, return_exceptions=True)
 
-        self.cleanup()
+            self.cleanup()
 
     def stop(self) -> None:
         """
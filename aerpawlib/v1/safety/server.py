@@ -39,13 +39,38 @@ from aerpawlib.v1.constants import (
     VEHICLE_TYPE_COPTER,
 )
 from aerpawlib.v1.log import LogComponent, get_logger
-from aerpawlib.v1.util import Coordinate, do_intersect, inside, read_geofence
+from aerpawlib.v1.util import (
+    Coordinate,
+    do_intersect,
+    inside_ray_edges,
+    polygon_edges,
+    polygon_ray_edges,
+    read_geofence,
+)
 
 from .wire_format import deserialize_msg, serialize_response
 
 logger = get_logger(LogComponent.SAFETY)
 
 
+def _polygon_bounds(polygon: list[dict]) -> tuple[float, float, float, float]:
+    """
+    Return the axis-aligned bounding box of a geofence polygon.
+
+    Args:
+        polygon: List of {'lat': ..., 'lon': ...} points.
+
+    Returns:
+        Tuple of (min_lon, min_lat, max_lon, max_lat). An empty polygon
+        yields an inverted box that contains no point.
+    """
+    if not polygon:
+        return (float("inf"), float("inf"), float("-inf"), float("-inf"))
+    lons = [p["lon"] for p in polygon]
+    lats = [p["lat"] for p in polygon]
+    return min(lons), min(lats), max(lons), max(lats)
+
+
 # noinspection PyUnusedLocal
 class SafetyCheckerServer:
     """
@@ -105,6 +130,7 @@ class SafetyCheckerServer:
         vehicle_config_dir = config_path.parent
         self.include_geofences = [read_geofence(str(vehicle_config_dir / geofence)) for geofence in config["include_geofences"]]
         self.exclude_geofences = [read_geofence(str(vehicle_config_dir / geofence)) for geofence in config["exclude_geofences"]]
+        self._index_geofences()
         self.max_speed = config["max_speed"]
         self.min_speed = config["min_speed"]
 
@@ -116,6 +142,23 @@ class SafetyCheckerServer:
 
         self.start_server(server_port)
 
+    def _index_geofences(self) -> None:
+        """
+        Precompute per-polygon data used by waypoint validation.
+
+        Bounding boxes let validation skip polygons that cannot contain the
+        point or intersect the path, flat edge tuples spare the intersection
+        loops from re-reading vertex dicts on every request, and ray edges
+        carry the per-edge differences the containment test would otherwise
+        recompute.
+        """
+        self._include_bounds = [_polygon_bounds(gf) for gf in self.include_geofences]
+        self._include_edges = [polygon_edges(gf) for gf in self.include_geofences]
+        self._include_rays = [polygon_ray_edges(gf) for gf in self.include_geofences]
+        self._exclude_bounds = [_polygon_bounds(zone) for zone in self.exclude_geofences]
+        self._exclude_edges = [polygon_edges(zone) for zone in self.exclude_geofences]
+        self._exclude_rays = [polygon_ray_edges(zone) for zone in self.exclude_geofences]
+
     def start_server(
         self,
         port: int,
@@ -220,56 +263,43 @@ class SafetyCheckerServer:
                 (f"Invalid waypoint. Altitude of {next_location.alt} m is not within restrictions! ABORTING!"),
             )
 
-        dest_geofence = None
-        for gf in self.include_geofences:
-            if inside(next_location.lon, next_location.lat, gf):
-                dest_geofence = gf
+        lon = next_location.lon
+        lat = next_location.lat
+        dest_edges = None
+        for (min_lon, min_lat, max_lon, max_lat), edges, rays in zip(self._include_bounds, self._include_edges, self._include_rays, strict=True):
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and inside_ray_edges(lon, lat, rays):
+                dest_edges = edges
                 break
-        if dest_geofence is None:
+        if dest_edges is None:
             return (
                 False,
                 (f"Invalid waypoint. Waypoint ({next_location.lat},{next_location.lon}) is outside of the geofence. ABORTING!"),
             )
-        for zone in self.exclude_geofences:
-            if inside(next_location.lon, next_location.lat, zone):
+        for (min_lon, min_lat, max_lon, max_lat), rays in zip(self._exclude_bounds, self._exclude_rays, strict=True):
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and inside_ray_edges(lon, lat, rays):
                 return (
                     False,
                     (f"Invalid waypoint. Waypoint ({next_location.lat},{next_location.lon}) is inside a no-go zone. ABORTING!"),
                 )
-        n = len(dest_geofence)
-        for i in range(n):
-            p1 = dest_geofence[i]
-            p2 = dest_geofence[(i + 1) % n]
-            if do_intersect(
-                p1["lon"],
-                p1["lat"],
-                p2["lon"],
-                p2["lat"],
-                current_location.lon,
-                current_location.lat,
-                next_location.lon,
-                next_location.lat,
-            ):
+        cur_lon = current_location.lon
+        cur_lat = current_location.lat
+        for lon_i, lat_i, lon_j, lat_j in dest_edges:
+            if do_intersect(lon_i, lat_i, lon_j, lat_j, cur_lon, cur_lat, lon, lat):
                 return (
                     False,
                     (f"Invalid waypoint. Path from ({current_location.lat},{current_location.lon}) to waypoint ({next_location.lat},{next_location.lon}) leaves geofence. ABORTING!"),
                 )
 
-        for zone in self.exclude_geofences:
-            m = len(zone)
-            for j in range(m):
-                p1 = zone[j]
-                p2 = zone[(j + 1) % m]
-                if do_intersect(
-                    p1["lon"],
-                    p1["lat"],
-                    p2["lon"],
-                    p2["lat"],
-                    current_location.lon,
-                    current_location.lat,
-                    next_location.lon,
-                    next_location.lat,
-                ):
+        path_min_lon = min(cur_lon, lon)
+        path_max_lon = max(cur_lon, lon)
+        path_min_lat = min(cur_lat, lat)
+        path_max_lat = max(cur_lat, lat)
+        for (min_lon, min_lat, max_lon, max_lat), edges in zip(self._exclude_bounds, self._exclude_edges, strict=True):
+            # The path cannot cross a zone whose bounding box it does not touch.
+            if path_max_lon < min_lon or path_min_lon > max_lon or path_max_lat < min_lat or path_min_lat > max_lat:
+                continue
+            for lon_i, lat_i, lon_j, lat_j in edges:
+                if do_intersect(lon_i, lat_i, lon_j, lat_j, cur_lon, cur_lat, lon, lat):
                     return (
                         False,
                         (f"Invalid waypoint. Path from ({current_location.lat},{current_location.lon}) to waypoint ({next_location.lat},{next_location.lon}) enters no-go zone. ABORTING!"),
@@ -6,9 +6,12 @@ from .geofence import (
     do_intersect,
     doIntersect,
     inside,
+    inside_ray_edges,
     lies_on_segment,
     liesOnSegment,
     orientation,
+    polygon_edges,
+    polygon_ray_edges,
     read_geofence,
     readGeofence,
 )
@@ -28,11 +31,14 @@ __all__ = [
     "do_intersect",
     "get_location_from_waypoint",
     "inside",
+    "inside_ray_edges",
     "is_tcp_port_in_use",
     "is_udp_port_in_use",
     "liesOnSegment",
     "lies_on_segment",
     "orientation",
+    "polygon_edges",
+    "polygon_ray_edges",
     "readGeofence",
     "read_from_plan",
     "read_from_plan_complete",
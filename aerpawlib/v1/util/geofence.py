@@ -35,14 +35,85 @@ def read_geofence(file_path: str) -> list[dict]:
     coordinates_list = coordinates_string.split()
     polygon = []
     for str_val in coordinates_list:
+        parts = str_val.split(",")
         point = {
-            "lon": float(str_val.split(",")[0]),
-            "lat": float(str_val.split(",")[1]),
+            "lon": float(parts[0]),
+            "lat": float(parts[1]),
         }
         polygon.append(point)
     return polygon
 
 
+def polygon_edges(polygon: list[dict]) -> list[tuple[float, float, float, float]]:
+    """
+    Return the edges of a polygon as flat coordinate tuples.
+
+    Args:
+        polygon: List of {'lat': ..., 'lon': ...} points.
+
+    Returns:
+        List of (lon_i, lat_i, lon_j, lat_j) tuples, one per edge, wrapping
+        from the last vertex back to the first.
+    """
+    n = len(polygon)
+    edges = []
+    for i in range(n):
+        p1 = polygon[i]
+        p2 = polygon[(i + 1) % n]
+        edges.append((p1["lon"], p1["lat"], p2["lon"], p2["lat"]))
+    return edges
+
+
+def polygon_ray_edges(polygon: list[dict]) -> list[tuple[float, float, float, float, float]]:
+    """
+    Precompute the per-edge terms of the ray-casting point-in-polygon test.
+
+    Build these once per polygon and pass them to `inside_ray_edges` when the
+    same polygon is tested against many points. Horizontal edges never
+    straddle a point's latitude, so they are dropped.
+
+    Args:
+        polygon: List of {'lat': ..., 'lon': ...} points.
+
+    Returns:
+        List of (lat_i, lat_j, lon_i, lon_j - lon_i, lat_j - lat_i) tuples,
+        where j is the vertex preceding i.
+    """
+    edges = []
+    if not polygon:
+        return edges
+    prev = polygon[-1]
+    lonj = prev["lon"]
+    latj = prev["lat"]
+    for point in polygon:
+        loni = point["lon"]
+        lati = point["lat"]
+        if lati != latj:
+            edges.append((lati, latj, loni, lonj - loni, latj - lati))
+        lonj = loni
+        latj = lati
+    return edges
+
+
+def inside_ray_edges(lon: float, lat: float, edges: list[tuple[float, float, float, float, float]]) -> bool:
+    """
+    Determine if a point is inside a polygon using ray-casting.
+
+    Args:
+        lon: Longitude of point.
+        lat: Latitude of point.
+        edges: Edge terms from `polygon_ray_edges`.
+
+    Returns:
+        bool: True if inside, False otherwise.
+    """
+    result = False
+    for lati, latj, loni, dlon, dlat in edges:
+        if ((lati > lat) != (latj > lat)) and (lon < dlon * (lat - lati) / dlat + loni):
+            result = not result
+    return result
+
+
 def inside(lon: float, lat: float, geofence: list[dict]) -> bool:
     """
     Determine if a point is inside a polygon using ray-casting.
@@ -56,20 +127,22 @@ def inside(lon: float, lat: float, geofence: list[dict]) -> bool:
         bool: True if inside, False otherwise.
     """
     inside = False
-    i = 0
-    j = len(geofence) - 1
+    if not geofence:
+        return inside
 
-    while i < len(geofence):
-        loni = geofence[i]["lon"]
-        lati = geofence[i]["lat"]
-        lonj = geofence[j]["lon"]
-        latj = geofence[j]["lat"]
+    # Carry the previous vertex in locals so each vertex dict is read once.
+    prev = geofence[-1]
+    lonj = prev["lon"]
+    latj = prev["lat"]
+    for point in geofence:
+        loni = point["lon"]
+        lati = point["lat"]
 
         intersect = ((lati > lat) != (latj > lat)) and (lon < (lonj - loni) * (lat - lati) / (latj - lati) + loni)
         if intersect:
             inside = not inside
-        j = i
-        i += 1
+        lonj = loni
+        latj = lati
 
     return inside
 
@@ -115,7 +188,7 @@ def orientation(
     Returns:
         int: 0 if colinear, 1 if clockwise, 2 if counterclockwise.
     """
-    val = (float(qy - py) * (rx - qx)) - (float(qx - px) * (ry - qy))
+    val = (qy - py) * (rx - qx) - (qx - px) * (ry - qy)
     if val > 0:
         return 1
     if val < 0:
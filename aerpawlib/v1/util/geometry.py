@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import math
+from collections.abc import Iterable
 
 from aerpawlib.v1.constants import (
     COORDINATE_EPSILON,
@@ -66,12 +67,35 @@ class VectorNED:
             VectorNED: A new VectorNED object representing the rotated displacement.
         """
         rads = angle / 180 * math.pi
+        cos_r = math.cos(rads)
+        sin_r = math.sin(rads)
 
-        east = self.east * math.cos(rads) - self.north * math.sin(rads)
-        north = self.east * math.sin(rads) + self.north * math.cos(rads)
+        east = self.east * cos_r - self.north * sin_r
+        north = self.east * sin_r + self.north * cos_r
 
         return VectorNED(north, east, self.down)
 
+    @staticmethod
+    def rotate_many(vectors: Iterable[VectorNED], angle: float) -> list[VectorNED]:
+        """
+        Rotate each vector by the same angle in the horizontal plane.
+
+        Equivalent to ``[v.rotate_by_angle(angle) for v in vectors]`` but
+        evaluates the sine and cosine once for the whole batch.
+
+        Args:
+            vectors: The vectors to rotate.
+            angle: The rotation angle in degrees (counterclockwise
+                when viewed from above).
+
+        Returns:
+            List[VectorNED]: One rotated vector per input, in order.
+        """
+        rads = angle / 180 * math.pi
+        cos_r = math.cos(rads)
+        sin_r = math.sin(rads)
+        return [VectorNED(v.east * sin_r + v.north * cos_r, v.east * cos_r - v.north * sin_r, v.down) for v in vectors]
+
     def cross_product(self, o: VectorNED) -> VectorNED:
         """
         Calculate the cross product of this vector and another.
@@ -106,7 +130,7 @@ class VectorNED:
         """
         if ignore_down:
             return math.hypot(self.north, self.east)
-        return math.sqrt(self.north**2 + self.east**2 + self.down**2)
+        return math.hypot(self.north, self.east, self.down)
 
     def norm(self) -> VectorNED:
         """
@@ -177,8 +201,7 @@ class Coordinate:
         if not isinstance(other, Coordinate):
             raise TypeError()
 
-        other = Coordinate(other.lat, other.lon, self.alt)
-        return self.distance(other)
+        return self._haversine_m(other)
 
     def distance(self, other: Coordinate) -> float:
         """
@@ -198,15 +221,29 @@ class Coordinate:
         if not isinstance(other, Coordinate):
             raise TypeError()
 
+        return self._distance_m(other)
+
+    def _distance_m(self, other: Coordinate) -> float:
+        """3D distance in meters, without validating 'other'."""
+        ground = self._haversine_m(other)
+        d_alt = other.alt - self.alt
+        if d_alt == 0:
+            return ground
+        return math.hypot(ground, d_alt)
+
+    def _haversine_m(self, other: Coordinate) -> float:
+        """Haversine ground distance in meters, without validating 'other'."""
         d2r = math.pi / 180
         dlon = (other.lon - self.lon) * d2r
         dlat = (other.lat - self.lat) * d2r
         a = math.pow(math.sin(dlat / 2), 2) + math.cos(self.lat * d2r) * math.cos(
             other.lat * d2r,
         ) * math.pow(math.sin(dlon / 2), 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        # asin form of the haversine; rounding can push sqrt(a) past 1 near antipodes
+        sqrt_a = math.sqrt(a)
+        c = 2 * math.asin(sqrt_a) if sqrt_a < 1 else math.pi
         d = EARTH_RADIUS_KM * c
-        return math.hypot(d * 1000, other.alt - self.alt)
+        return d * 1000
 
     def bearing(
         self,
@@ -257,6 +294,39 @@ class Coordinate:
 
         return Coordinate(new_lat, new_lon, self.alt + alt)
 
+    def offset_many(self, vectors: Iterable[VectorNED]) -> list[Coordinate]:
+        """
+        Offset this coordinate by each vector in turn.
+
+        Equivalent to ``[self + v for v in vectors]`` but computes the
+        latitude-dependent longitude scale once for the whole batch.
+
+        Args:
+            vectors: NED offsets to apply to this coordinate.
+
+        Returns:
+            List[Coordinate]: One coordinate per vector, in order.
+
+        Raises:
+            TypeError: If any element is not a VectorNED object.
+        """
+        earth_radius = EARTH_RADIUS_M
+        lon_radius = earth_radius * math.cos(math.pi * self.lat / 180)
+        out = []
+        for v in vectors:
+            if not isinstance(v, VectorNED):
+                raise TypeError()
+            d_lat = v.north / earth_radius
+            d_lon = v.east / lon_radius
+            out.append(
+                Coordinate(
+                    self.lat + (d_lat * 180 / math.pi),
+                    self.lon + (d_lon * 180 / math.pi),
+                    self.alt - v.down,
+                ),
+            )
+        return out
+
     def __sub__(self, o):
         if isinstance(o, VectorNED):
             return self + VectorNED(-o.north, -o.east, -o.down)
@@ -327,7 +327,7 @@ class Drone(Vehicle):
                 ),
             )
 
-            self._ready_to_move = lambda s: coordinates.distance(s.position) <= tolerance
+            self._ready_to_move = lambda s: coordinates._distance_m(s.position) <= tolerance
             await wait_for_condition(
                 lambda: self._ready_to_move(self),
                 poll_interval=POLLING_DELAY_S,
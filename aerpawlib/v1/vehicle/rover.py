@@ -193,7 +193,7 @@ class Rover(Vehicle):
                 ),
             )
 
-            self._ready_to_move = lambda s: coordinates.ground_distance(s.position) <= tolerance
+            self._ready_to_move = lambda s: coordinates._haversine_m(s.position) <= tolerance
 
             logger.debug(f"Waiting to reach destination (tolerance={tolerance}m)...")
             await wait_for_condition(
@@ -20,16 +20,23 @@ class AerpawlibError(Exception):
         original_error: Underlying exception if any
     """
 
+    # Each subclass declares its default code and severity once here instead
+    # of passing them through every constructor call.
+    code: str = "UNKNOWN"
+    severity: Severity = "error"
+
     def __init__(
         self,
         message: str,
-        code: str = "UNKNOWN",
-        severity: Severity = "error",
+        code: str | None = None,
+        severity: Severity | None = None,
         original_error: Exception | None = None,
     ) -> None:
         self.message = message
-        self.code = code
-        self.severity = severity
+        if code is not None:
+            self.code = code
+        if severity is not None:
+            self.severity = severity
         self.original_error = original_error
         super().__init__(message)
 
@@ -43,14 +50,14 @@ class AerpawlibError(Exception):
 class AerpawConnectionError(AerpawlibError):
     """Base for connection errors."""
 
-    def __init__(self, message: str, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "CONNECTION_ERROR")
-        super().__init__(message, **kwargs)
+    code = "CONNECTION_ERROR"
 
 
 class ConnectionTimeoutError(AerpawConnectionError):
     """Connection timed out."""
 
+    code = "CONNECTION_TIMEOUT"
+
     def __init__(
         self,
         timeout_seconds: float,
@@ -65,7 +72,6 @@ class ConnectionTimeoutError(AerpawConnectionError):
                 description.
         """
         self.timeout_seconds = timeout_seconds
-        kwargs.setdefault("code", "CONNECTION_TIMEOUT")
         msg = message or f"Connection timed out after {timeout_seconds}s"
         super().__init__(msg, **kwargs)
 
@@ -73,6 +79,9 @@ class ConnectionTimeoutError(AerpawConnectionError):
 class HeartbeatLostError(AerpawConnectionError):
     """Vehicle heartbeat lost."""
 
+    code = "HEARTBEAT_LOST"
+    severity = "critical"
+
     def __init__(
         self,
         last_heartbeat_age: float = 0.0,
@@ -86,8 +95,6 @@ class HeartbeatLostError(AerpawConnectionError):
             message: Optional custom message; defaults to a standard description.
         """
         self.last_heartbeat_age = last_heartbeat_age
-        kwargs.setdefault("code", "HEARTBEAT_LOST")
-        kwargs.setdefault("severity", "critical")
         msg = message or f"Heartbeat lost (last {last_heartbeat_age:.1f}s ago)"
         super().__init__(msg, **kwargs)
 
@@ -95,6 +102,8 @@ class HeartbeatLostError(AerpawConnectionError):
 class PortInUseError(AerpawConnectionError):
     """Port already in use."""
 
+    code = "PORT_IN_USE"
+
     def __init__(self, port: int, message: str | None = None, **kwargs: Any) -> None:
         """Initialize with the conflicting port number.
 
@@ -103,7 +112,6 @@ class PortInUseError(AerpawConnectionError):
             message: Optional custom message; defaults to a standard description.
         """
         self.port = port
-        kwargs.setdefault("code", "PORT_IN_USE")
         msg = message or f"Port {port} is already in use"
         super().__init__(msg, **kwargs)
 
@@ -112,97 +120,103 @@ class PortInUseError(AerpawConnectionError):
 class CommandError(AerpawlibError):
     """Base for command execution errors."""
 
-    def __init__(self, message: str, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "COMMAND_ERROR")
-        super().__init__(message, **kwargs)
+    code = "COMMAND_ERROR"
 
 
 class ArmError(CommandError):
     """Raised when an arm command fails."""
 
+    code = "ARM_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(f"Failed to arm: {reason}", code="ARM_ERROR", **kwargs)
+        super().__init__(f"Failed to arm: {reason}", **kwargs)
 
 
 class DisarmError(CommandError):
     """Raised when a disarm command fails."""
 
+    code = "DISARM_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(f"Failed to disarm: {reason}", code="DISARM_ERROR", **kwargs)
+        super().__init__(f"Failed to disarm: {reason}", **kwargs)
 
 
 class TakeoffError(CommandError):
     """Raised when a takeoff command fails."""
 
+    code = "TAKEOFF_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(f"Takeoff failed: {reason}", code="TAKEOFF_ERROR", **kwargs)
+        super().__init__(f"Takeoff failed: {reason}", **kwargs)
 
 
 class LandingError(CommandError):
     """Raised when a landing command fails."""
 
+    code = "LANDING_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(f"Landing failed: {reason}", code="LANDING_ERROR", **kwargs)
+        super().__init__(f"Landing failed: {reason}", **kwargs)
 
 
 class TaskCancelledError(CommandError):
     """Raised when a non-blocking VehicleTask is cancelled."""
 
+    code = "TASK_CANCELLED"
+
     def __init__(self, message: str = "Task was cancelled", **kwargs: Any) -> None:
-        super().__init__(message, code="TASK_CANCELLED", **kwargs)
+        super().__init__(message, **kwargs)
 
 
 class NavigationError(CommandError):
     """Raised when navigation to a target cannot be completed."""
 
+    code = "NAVIGATION_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(
-            f"Navigation failed: {reason}",
-            code="NAVIGATION_ERROR",
-            **kwargs,
-        )
+        super().__init__(f"Navigation failed: {reason}", **kwargs)
 
 
 class VelocityError(CommandError):
     """Raised when a velocity command cannot be applied."""
 
+    code = "VELOCITY_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(
-            f"Set velocity failed: {reason}",
-            code="VELOCITY_ERROR",
-            **kwargs,
-        )
+        super().__init__(f"Set velocity failed: {reason}", **kwargs)
 
 
 class RTLError(CommandError):
     """Raised when return-to-launch fails."""
 
+    code = "RTL_ERROR"
+
     def __init__(self, reason: str = "Unknown", **kwargs: Any) -> None:
-        super().__init__(f"RTL failed: {reason}", code="RTL_ERROR", **kwargs)
+        super().__init__(f"RTL failed: {reason}", **kwargs)
 
 
 # State
 class StateError(AerpawlibError):
     """Base for vehicle state errors."""
 
-    def __init__(self, message: str, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "STATE_ERROR")
-        super().__init__(message, **kwargs)
+    code = "STATE_ERROR"
 
 
 class NotArmableError(StateError):
     """Raised when the vehicle cannot be armed in its current state."""
 
+    code = "NOT_ARMABLE"
+
     def __init__(self, reason: str = "Vehicle not armable", **kwargs: Any) -> None:
-        kwargs.setdefault("code", "NOT_ARMABLE")
         super().__init__(f"Cannot arm: {reason}", **kwargs)
 
 
 class NotConnectedError(StateError):
     """Raised when a command requires an active vehicle connection."""
 
+    code = "NOT_CONNECTED"
+
     def __init__(self, message: str = "Vehicle not connected", **kwargs: Any) -> None:
-        kwargs.setdefault("code", "NOT_CONNECTED")
         super().__init__(message, **kwargs)
 
 
@@ -210,22 +224,23 @@ class NotConnectedError(StateError):
 class RunnerError(AerpawlibError):
     """Base for runner/state machine errors."""
 
-    def __init__(self, message: str, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "RUNNER_ERROR")
-        super().__init__(message, **kwargs)
+    code = "RUNNER_ERROR"
 
 
 class NoEntrypointError(RunnerError):
     """Raised when a runner has no method marked with ``@entrypoint``."""
 
+    code = "NO_ENTRYPOINT"
+
     def __init__(self, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "NO_ENTRYPOINT")
         super().__init__("No @entrypoint declared", **kwargs)
 
 
 class InvalidStateError(RunnerError):
     """Raised when a state machine transitions to an unknown state."""
 
+    code = "INVALID_STATE"
+
     def __init__(
         self,
         state_name: str,
@@ -240,7 +255,6 @@ class InvalidStateError(RunnerError):
         """
         self.state_name = state_name
         self.available_states = available_states
-        kwargs.setdefault("code", "INVALID_STATE")
         super().__init__(
             f"Invalid state '{state_name}'. Available: {available_states}",
             **kwargs,
@@ -250,43 +264,48 @@ class InvalidStateError(RunnerError):
 class NoInitialStateError(RunnerError):
     """Raised when no state is marked as the initial state."""
 
+    code = "NO_INITIAL_STATE"
+
     def __init__(self, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "NO_INITIAL_STATE")
         super().__init__("No initial state", **kwargs)
 
 
 class MultipleInitialStatesError(RunnerError):
     """Raised when more than one state is marked initial."""
 
+    code = "MULTIPLE_INITIAL_STATES"
+
     def __init__(self, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "MULTIPLE_INITIAL_STATES")
         super().__init__("Multiple initial states", **kwargs)
 
 
 class InvalidStateNameError(RunnerError):
     """Raised when a state decorator is given an empty name."""
 
+    code = "INVALID_STATE_NAME"
+
     def __init__(self, **kwargs: Any) -> None:
-        kwargs.setdefault("code", "INVALID_STATE_NAME")
         super().__init__("State name cannot be empty", **kwargs)
 
 
 class UnexpectedDisarmError(StateError):
     """Raised when the vehicle disarms unexpectedly during execution."""
 
+    code = "UNEXPECTED_DISARM"
+    severity = "critical"
+
     def __init__(
         self,
         message: str = "Vehicle disarmed unexpectedly during experiment",
         **kwargs: Any,
     ) -> None:
-        kwargs.setdefault("code", "UNEXPECTED_DISARM")
-        kwargs.setdefault("severity", "critical")
         super().__init__(message, **kwargs)
 
 
 class PlanError(AerpawlibError):
     """Raised when a plan file cannot be parsed."""
 
+    code = "PLAN_ERROR"
+
     def __init__(self, message: str = "Plan file error", **kwargs: Any) -> None:
-        kwargs.setdefault("code", "PLAN_ERROR")
         super().__init__(message, **kwargs)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import re
+from collections.abc import AsyncIterator
 
 
 class ExternalProcess:
@@ -48,6 +49,14 @@ class ExternalProcess:
             return None
         return line.decode("ascii", errors="replace").rstrip()
 
+    async def read_lines(self) -> AsyncIterator[str]:
+        """Iterate over stdout lines until the process closes stdout."""
+        while True:
+            line = await self.read_line()
+            if line is None:
+                return
+            yield line
+
     async def send_input(self, data: str) -> None:
         """Send a string to the process's stdin.
 
@@ -81,10 +90,11 @@ class ExternalProcess:
             collected if the process ends before a match is found.
         """
         buff: list[str] = []
+        search = re.compile(output_regex).search
         while True:
             out = await self.read_line()
             if out is None:
                 return buff
             buff.append(out)
-            if re.search(output_regex, out):
+            if search(out):
                 return buff
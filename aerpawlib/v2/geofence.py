@@ -12,7 +12,7 @@ from pykml import parser
 from .log import LogComponent, get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
 logger = get_logger(LogComponent.VEHICLE)
 
@@ -41,9 +41,10 @@ def read_geofence(file_path: str) -> list[dict]:
         ".//{http://www.opengis.net/kml/2.2}outerBoundaryIs/{http://www.opengis.net/kml/2.2}LinearRing/{http://www.opengis.net/kml/2.2}coordinates",
         ".//outerBoundaryIs/LinearRing/coordinates",
     ]:
-        results = root.findall(xpath)
-        if results:
-            coords_el = results[0]
+        # find() stops at the first match instead of collecting every
+        # LinearRing in the document.
+        coords_el = root.find(xpath)
+        if coords_el is not None:
             break
 
     if coords_el is None or not coords_el.text:
@@ -68,6 +69,36 @@ def read_geofence(file_path: str) -> list[dict]:
     return polygon
 
 
+def _ray_edges(geofence: list[dict]) -> list[tuple[float, float, float, float, float]]:
+    """Precompute the per-edge terms of the ray-casting test.
+
+    Horizontal edges never straddle a point's latitude, so they are dropped,
+    which also keeps the division in ``_inside_edges`` away from zero.
+
+    Returns:
+        List of (lat_i, lat_j, lon_i, lon_j - lon_i, lat_j - lat_i) tuples,
+        where j is the vertex preceding i.
+    """
+    edges = []
+    prev = geofence[-1]
+    lonj, latj = prev["lon"], prev["lat"]
+    for point in geofence:
+        loni, lati = point["lon"], point["lat"]
+        if lati != latj:
+            edges.append((lati, latj, loni, lonj - loni, latj - lati))
+        lonj, latj = loni, lati
+    return edges
+
+
+def _inside_edges(lon: float, lat: float, edges: list[tuple[float, float, float, float, float]]) -> bool:
+    """Ray-casting test of (lon, lat) against edges from ``_ray_edges``."""
+    inside_flag = False
+    for lati, latj, loni, dlon, dlat in edges:
+        if (lati > lat) != (latj > lat) and lon < dlon * (lat - lati) / dlat + loni:
+            inside_flag = not inside_flag
+    return inside_flag
+
+
 def inside(lon: float, lat: float, geofence: list[dict]) -> bool:
     """Check if point (lon, lat) is inside the polygon using ray-casting.
 
@@ -82,23 +113,45 @@ def inside(lon: float, lat: float, geofence: list[dict]) -> bool:
     Returns:
         True if the point is inside the polygon.
     """
-    n = len(geofence)
-    if n < 3:
+    if len(geofence) < 3:
         return False
     inside_flag = False
-    j = n - 1
-    for i in range(n):
-        loni, lati = geofence[i]["lon"], geofence[i]["lat"]
-        lonj, latj = geofence[j]["lon"], geofence[j]["lat"]
-        # Skip horizontal edges (latj == lati) to avoid division by zero
-        if lati != latj and ((lati > lat) != (latj > lat)):
+    # Walk the edges once, carrying the previous vertex in locals so each
+    # vertex dict is only read once per call.
+    prev = geofence[-1]
+    lonj, latj = prev["lon"], prev["lat"]
+    for point in geofence:
+        loni, lati = point["lon"], point["lat"]
+        # A horizontal edge (latj == lati) never straddles lat, so the
+        # division below is only reached when latj != lati.
+        if (lati > lat) != (latj > lat):
             x_intersect = (lonj - loni) * (lat - lati) / (latj - lati) + loni
             if lon < x_intersect:
                 inside_flag = not inside_flag
-        j = i
+        lonj, latj = loni, lati
     return inside_flag
 
 
+def points_inside(points: Iterable[tuple[float, float]], geofence: list[dict]) -> list[bool]:
+    """Check many (lon, lat) points against one polygon.
+
+    Gives the same answers as calling ``inside`` for each point, but unpacks
+    the polygon edges once for the whole batch, which is cheaper when
+    sweeping a planned trajectory.
+
+    Args:
+        points: Iterable of (lon, lat) pairs.
+        geofence: List of {'lat': ..., 'lon': ...} dicts defining the polygon.
+
+    Returns:
+        One bool per point, True where the point is inside the polygon.
+    """
+    if len(geofence) < 3:
+        return [False for _ in points]
+    edges = _ray_edges(geofence)
+    return [_inside_edges(lon, lat, edges) for lon, lat in points]
+
+
 def _lies_on_segment(
     px: float,
     py: float,
@@ -290,7 +290,7 @@ class StateMachine(Runner):
         """
         return self._get_config().at_init
 
-    async def _run_state(self, spec: StateSpec, vehicle: Any) -> str:
+    async def _run_state(self, spec: StateSpec, vehicle: Any, method: Any = None) -> str:
         """Execute a single state and return the name of the next state.
 
         For timed states the method runs (optionally in a loop) for ``spec.duration``
@@ -299,37 +299,35 @@ class StateMachine(Runner):
         Args:
             spec: Metadata describing the state to run.
             vehicle: The vehicle instance passed to the state method.
+            method: Pre-bound state method; resolved from ``spec`` if omitted.
 
         Returns:
             Name of the next state, or an empty string / None to stop the machine.
         """
-        method = self._get_runner_method(spec.method_name)
+        if method is None:
+            method = self._get_runner_method(spec.method_name)
         logger.debug(f"StateMachine: entering state '{spec.name}'")
         if spec.duration <= 0:
             return await method(vehicle)
-        stop_event = asyncio.Event()
-        last_state = ""
-
-        async def _bg() -> str:
-            """Execute timed-state iterations until stop_event is set."""
-            nonlocal last_state
-            while not stop_event.is_set():
-                last_state = await method(vehicle)
-                if stop_event.is_set():
-                    break
-                if not spec.loop:
-                    stop_event.set()
-                    break
-                await asyncio.sleep(STATE_MACHINE_DELAY_S)
-            return last_state
-
-        task = asyncio.create_task(_bg())
         logger.debug(
             f"StateMachine: timed_state '{spec.name}' (duration={spec.duration}s, loop={spec.loop})",
         )
-        await asyncio.sleep(spec.duration)
-        stop_event.set()
-        return await task
+        # Drive the state from a single deadline instead of racing a helper
+        # task against sleep(duration): no extra task or Event per entry, and
+        # a looping state no longer overruns by up to one tick.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + spec.duration
+        while True:
+            last_state = await method(vehicle)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return last_state
+            if not spec.loop:
+                await asyncio.sleep(remaining)
+                return last_state
+            await asyncio.sleep(min(STATE_MACHINE_DELAY_S, remaining))
+            if loop.time() >= deadline:
+                return last_state
 
     async def run(self, vehicle: Any) -> None:
         """Run the state machine from the initial state to completion.
@@ -345,6 +343,8 @@ class StateMachine(Runner):
             InvalidStateError: If a state transition targets an unknown state.
         """
         states = self._get_states()
+        # Bind each state method once per run instead of on every transition.
+        state_methods = {name: self._get_runner_method(spec.method_name) for name, spec in states.items()}
         self._background_futures = []
         self._current_state = self._get_initial_state()
         self._running = True
@@ -380,6 +380,7 @@ class StateMachine(Runner):
                         try:
                             await task(vehicle)
                             consecutive_failures = 0
+                            continue
                         except asyncio.CancelledError:
                             return
                         except Exception as e:
@@ -395,11 +396,15 @@ class StateMachine(Runner):
                                 f"Background task '{_name}' failed (attempt {consecutive_failures}/{max_background_retries}), retrying in {backoff:.1f}s: {e}",
                                 exc_info=True,
                             )
-                            await asyncio.sleep(backoff)
+                        # Back off outside the except block so the exception and
+                        # the frames held by its traceback are released first.
+                        await asyncio.sleep(backoff)
 
                 fut = asyncio.create_task(_bg_task(method))
                 self._background_futures.append(fut)
 
+            from aerpawlib.cli.progress_bar import update_progress
+
             while self._running:
                 current_state = self._current_state
                 assert current_state is not None
@@ -409,14 +414,12 @@ class StateMachine(Runner):
                     )
                     raise InvalidStateError(current_state, list(states.keys()))
                 spec = states[current_state]
-                from aerpawlib.cli.progress_bar import update_progress
-
                 update_progress(
                     f"Running state: {current_state}",
                     completed=70,
                     state=current_state,
                 )
-                next_state = await self._run_state(spec, vehicle)
+                next_state = await self._run_state(spec, vehicle, state_methods[current_state])
                 if self._next_state_overrides:
                     self._current_state = self._next_state_overrides.pop(0)
                     logger.info(
@@ -466,6 +469,7 @@ class ZmqStateMachine(StateMachine):
         self._zmq_context: zmq.asyncio.Context | None = None
         self._zmq_send_queue: asyncio.Queue | None = None
         self._zmq_received_fields: dict[str, dict[str, Any]] = {}
+        self._zmq_field_methods: dict[str, Any] | None = None
 
     def _initialize_zmq_bindings(
         self,
@@ -490,6 +494,19 @@ class ZmqStateMachine(StateMachine):
             raise RunnerError("ZmqStateMachine requires config from @state/@expose_zmq")
         return cfg
 
+    def _zmq_field_method(self, field_name: str) -> Any:
+        """Return the bound method exposed as *field_name*, or None.
+
+        Exposed fields are bound once on first use rather than resolved
+        through the descriptor protocol on every FIELD_REQUEST.
+        """
+        methods = self._zmq_field_methods
+        if methods is None:
+            cfg = self._get_zmq_config()
+            methods = {field: self._get_runner_method(name) for field, name in cfg.exposed_fields.items()}
+            self._zmq_field_methods = methods
+        return methods.get(field_name)
+
     async def _zmq_recv_loop(self, vehicle: Any) -> None:
         """Subscribe to the ZMQ proxy and handle messages sequentially.
 
@@ -591,11 +608,9 @@ class ZmqStateMachine(StateMachine):
                 return
             field_name = cast("str", field)
             sender_name = cast("str", sender)
-            cfg = self._get_zmq_config()
             return_val = None
-            method_name = cfg.exposed_fields.get(field_name)
-            if method_name is not None:
-                method = self._get_runner_method(method_name)
+            method = self._zmq_field_method(field_name)
+            if method is not None:
                 return_val = await method(vehicle)
             await self._zmq_send_reply(sender_name, field_name, return_val)
 
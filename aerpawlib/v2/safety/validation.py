@@ -30,13 +30,14 @@ class PreflightChecks:
         Returns:
             True if fix_type >= GPS_3D_FIX_TYPE, False otherwise.
         """
-        if vehicle.gps.fix_type >= GPS_3D_FIX_TYPE:
+        gps = vehicle.gps
+        if gps.fix_type >= GPS_3D_FIX_TYPE:
             logger.debug(
-                f"Preflight: GPS OK (fix_type={vehicle.gps.fix_type}, sats={vehicle.gps.satellites_visible})",
+                f"Preflight: GPS OK (fix_type={gps.fix_type}, sats={gps.satellites_visible})",
             )
             return True
         logger.warning(
-            f"Preflight: No 3D GPS fix (fix_type={vehicle.gps.fix_type}, sats={vehicle.gps.satellites_visible})",
+            f"Preflight: No 3D GPS fix (fix_type={gps.fix_type}, sats={gps.satellites_visible})",
         )
         return False
 
@@ -54,13 +55,14 @@ class PreflightChecks:
         Returns:
             True if battery level >= min_percent, False otherwise.
         """
-        if vehicle.battery.level >= min_percent:
+        level = vehicle.battery.level
+        if level >= min_percent:
             logger.debug(
-                f"Preflight: Battery OK ({vehicle.battery.level}% >= {min_percent}%)",
+                f"Preflight: Battery OK ({level}% >= {min_percent}%)",
             )
             return True
         logger.warning(
-            f"Preflight: Battery {vehicle.battery.level}% below {min_percent}%",
+            f"Preflight: Battery {level}% below {min_percent}%",
         )
         return False
 
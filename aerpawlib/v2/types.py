@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from .constants import (
@@ -17,8 +18,13 @@ from .constants import (
     RAD_TO_DEG_FACTOR,
 )
 
+# Degrees to radians, hoisted out of the per-call haversine arithmetic.
+_D2R = math.pi / 180
 
-@dataclass
+_float_repr = float.__repr__
+
+
+@dataclass(slots=True)
 class VectorNED:
     """
     Displacement in NED (North, East, Down) coordinates, meters.
@@ -39,10 +45,32 @@ class VectorNED:
             New VectorNED rotated by angle_deg.
         """
         rads = angle_deg / 180 * math.pi
-        east = self.east * math.cos(rads) - self.north * math.sin(rads)
-        north = self.east * math.sin(rads) + self.north * math.cos(rads)
+        cos_r = math.cos(rads)
+        sin_r = math.sin(rads)
+        east = self.east * cos_r - self.north * sin_r
+        north = self.east * sin_r + self.north * cos_r
         return VectorNED(north, east, self.down)
 
+    @staticmethod
+    def rotate_many(vectors: Iterable[VectorNED], angle_deg: float) -> list[VectorNED]:
+        """Rotate each vector by the same angle.
+
+        Equivalent to ``[v.rotate_by_angle(angle_deg) for v in vectors]`` but
+        evaluates the sine and cosine once for the whole batch.
+
+        Args:
+            vectors: Vectors to rotate.
+            angle_deg: Rotation angle in degrees, counterclockwise when viewed
+                from above.
+
+        Returns:
+            One rotated VectorNED per input vector, in order.
+        """
+        rads = angle_deg / 180 * math.pi
+        cos_r = math.cos(rads)
+        sin_r = math.sin(rads)
+        return [VectorNED(v.east * sin_r + v.north * cos_r, v.east * cos_r - v.north * sin_r, v.down) for v in vectors]
+
     def hypot(
         self,
         ignore_down: bool = False,
@@ -57,7 +85,7 @@ class VectorNED:
         """
         if ignore_down:
             return math.hypot(self.north, self.east)
-        return math.sqrt(self.north**2 + self.east**2 + self.down**2)
+        return math.hypot(self.north, self.east, self.down)
 
     def norm(self) -> VectorNED:
         """Return the unit vector in the same direction.
@@ -102,7 +130,7 @@ class VectorNED:
     __rmul__ = __mul__
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinate:
     """
     Absolute point in WGS84 space.
@@ -126,8 +154,7 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             raise TypeError()
-        other = Coordinate(other.lat, other.lon, self.alt)
-        return self.distance(other)
+        return self._haversine_m(other)
 
     def distance(self, other: Coordinate) -> float:
         """Return the 3D distance to another coordinate in meters.
@@ -146,13 +173,25 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             raise TypeError()
-        d2r = math.pi / 180
-        dlon = (other.lon - self.lon) * d2r
-        dlat = (other.lat - self.lat) * d2r
-        a = math.sin(dlat / 2) ** 2 + math.cos(self.lat * d2r) * math.cos(other.lat * d2r) * math.sin(dlon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        d_ground = EARTH_RADIUS_KM * c * 1000  # km to m
-        return math.hypot(d_ground, other.alt - self.alt)
+        return self._distance_m(other)
+
+    def _distance_m(self, other: Coordinate) -> float:
+        """Return the 3D distance in metres without validating ``other``."""
+        ground = self._haversine_m(other)
+        d_alt = other.alt - self.alt
+        if d_alt == 0:
+            return ground
+        return math.hypot(ground, d_alt)
+
+    def _haversine_m(self, other: Coordinate) -> float:
+        """Return the Haversine ground distance to another coordinate in metres."""
+        dlon = (other.lon - self.lon) * _D2R
+        dlat = (other.lat - self.lat) * _D2R
+        a = math.sin(dlat / 2) ** 2 + math.cos(self.lat * _D2R) * math.cos(other.lat * _D2R) * math.sin(dlon / 2) ** 2
+        # asin form of the haversine; rounding can push sqrt(a) past 1 near antipodes
+        sqrt_a = math.sqrt(a)
+        c = 2 * math.asin(sqrt_a) if sqrt_a < 1 else math.pi
+        return EARTH_RADIUS_KM * c * 1000  # km to m
 
     def bearing(
         self,
@@ -185,15 +224,44 @@ class Coordinate:
     def __add__(self, o: VectorNED) -> Coordinate:
         if not isinstance(o, VectorNED):
             raise TypeError()
-        earth_radius = EARTH_RADIUS_M
-        d_lat = o.north / earth_radius
-        d_lon = o.east / (earth_radius * math.cos(math.pi * self.lat / 180))
+        d_lat = o.north / EARTH_RADIUS_M
+        d_lon = o.east / (EARTH_RADIUS_M * math.cos(math.pi * self.lat / 180))
         return Coordinate(
             self.lat + d_lat * 180 / math.pi,
             self.lon + d_lon * 180 / math.pi,
-            self.alt + (-o.down),
+            self.alt - o.down,
         )
 
+    def offset_many(self, vectors: Iterable[VectorNED]) -> list[Coordinate]:
+        """Return this coordinate offset by each vector in turn.
+
+        Equivalent to ``[self + v for v in vectors]`` but computes the
+        latitude-dependent longitude scale once for the whole batch.
+
+        Args:
+            vectors: NED offsets to apply to this coordinate.
+
+        Returns:
+            One Coordinate per vector, in order.
+
+        Raises:
+            TypeError: If any element is not a VectorNED.
+        """
+        lat, lon, alt = self.lat, self.lon, self.alt
+        lon_radius = EARTH_RADIUS_M * math.cos(math.pi * lat / 180)
+        out = []
+        for v in vectors:
+            if not isinstance(v, VectorNED):
+                raise TypeError()
+            out.append(
+                Coordinate(
+                    lat + v.north / EARTH_RADIUS_M * 180 / math.pi,
+                    lon + v.east / lon_radius * 180 / math.pi,
+                    alt - v.down,
+                ),
+            )
+        return out
+
     def __sub__(self, o: VectorNED | Coordinate) -> Coordinate | VectorNED:
         if isinstance(o, VectorNED):
             return self + VectorNED(-o.north, -o.east, -o.down)
@@ -214,10 +282,15 @@ class Coordinate:
         Returns:
             JSON string with lat, lon, and alt fields.
         """
-        return json.dumps({"lat": self.lat, "lon": self.lon, "alt": self.alt})
+        lat, lon, alt = self.lat, self.lon, self.alt
+        # Fixed three-float schema: format directly when json.dumps would
+        # produce the same text (finite built-in floats use float.__repr__).
+        if type(lat) is float and type(lon) is float and type(alt) is float and math.isfinite(lat + lon + alt):
+            return f'{{"lat": {_float_repr(lat)}, "lon": {_float_repr(lon)}, "alt": {_float_repr(alt)}}}'
+        return json.dumps({"lat": lat, "lon": lon, "alt": alt})
 
 
-@dataclass
+@dataclass(slots=True)
 class Battery:
     """Battery telemetry."""
 
@@ -226,7 +299,7 @@ class Battery:
     level: int  # 0-100
 
 
-@dataclass
+@dataclass(slots=True)
 class GPSInfo:
     """GPS telemetry."""
 
@@ -234,7 +307,7 @@ class GPSInfo:
     satellites_visible: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Attitude:
     """Attitude (roll, pitch, yaw in radians)."""
 
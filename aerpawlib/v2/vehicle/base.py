@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 from mavsdk import System
 from mavsdk.action import ActionError
 
-from aerpawlib.cli.progress_bar import update_telemetry
+from aerpawlib.cli.progress_bar import update_progress, update_telemetry
 from aerpawlib.v2.constants import (
     ARMABLE_STATUS_LOG_INTERVAL_S,
     ARMABLE_TIMEOUT_S,
@@ -683,6 +683,27 @@ class Vehicle:
         """Return True if the vehicle is ready to accept the next command."""
         return self._ready_to_move(self)
 
+    async def _wait_for_position_update(self, timeout: float, seen: int | None = None) -> int:
+        """Wait for a position sample newer than ``seen``, or at most ``timeout`` seconds.
+
+        Movement predicates only change when position telemetry arrives, so
+        arrival loops wait on this rather than re-checking on a fixed poll.
+        Each loop passes back the sequence number it was last given, so a
+        sample that lands while it is busy is not missed, and concurrent
+        waiters (e.g. takeoff and a goto) each see every sample. With
+        ``seen=None`` the call waits for the next sample.
+
+        Returns:
+            The position sequence number current when the wait ended.
+        """
+        state = self._state
+        if seen is None or seen == state._position_seq:
+            try:
+                await asyncio.wait_for(state._position_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return state._position_seq
+
     @property
     def _default_goto_tolerance(self) -> float:
         """Default arrival tolerance in metres for cardinal goto helpers."""
@@ -700,8 +721,6 @@ class Vehicle:
         """Poll until armable or timeout (used by preflight/initialize)."""
         start = time.monotonic()
         last_log = 0.0
-        from aerpawlib.cli.progress_bar import update_progress
-
         try:
             update_progress(state="Waiting for armable...")
             while not self._state.armable:
@@ -735,8 +754,6 @@ class Vehicle:
         """Arm in standalone/SITL mode after local preflight checks pass."""
         label = self._vehicle_type_label()
         logger.info(f"Standalone mode: auto-arming {label}...")
-        from aerpawlib.cli.progress_bar import update_progress
-
         try:
             update_progress(state="Waiting for armable...")
             await _wait_for_condition(
@@ -770,8 +787,6 @@ class Vehicle:
             ),
         )
         self._command_tasks.append(task)
-        from aerpawlib.cli.progress_bar import update_progress
-
         update_progress(state="Waiting for safety pilot to arm")
         await _wait_for_condition(
             lambda: self._state.armable,
@@ -5,13 +5,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import time
+import warnings
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
-from aerpawlib.v2.constants import (
-    HEARTBEAT_CHECK_INTERVAL_S,
-    HEARTBEAT_START_DELAY_S,
-)
+from aerpawlib.v2.constants import HEARTBEAT_START_DELAY_S
 from aerpawlib.v2.exceptions import HeartbeatLostError
 from aerpawlib.v2.log import LogComponent, get_logger
 
@@ -53,7 +51,7 @@ class ConnectionState:
         timeout: float,
         *,
         start_delay: float = HEARTBEAT_START_DELAY_S,
-        check_interval: float = HEARTBEAT_CHECK_INTERVAL_S,
+        check_interval: float | None = None,
         on_disconnect: Callable[[], None] | None = None,
     ) -> asyncio.Future:
         """Start monitoring telemetry staleness; return a Future that completes on loss.
@@ -61,19 +59,27 @@ class ConnectionState:
         Args:
             timeout: Seconds without telemetry before disconnect is signalled.
             start_delay: Grace period before the first timeout check.
-            check_interval: Poll interval for the monitor loop.
+            check_interval: Deprecated and ignored; the monitor sleeps until
+                the telemetry deadline instead of polling. Passing it emits a
+                DeprecationWarning.
             on_disconnect: Optional callback invoked when heartbeat is lost.
 
         Returns:
             asyncio.Future completed with HeartbeatLostError on disconnect.
         """
+        if check_interval is not None:
+            warnings.warn(
+                "watch_disconnect(check_interval=...) is ignored and will be removed; the monitor wakes at the telemetry deadline.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self._stop_monitor()
         self._on_disconnect = on_disconnect
         loop = asyncio.get_running_loop()
         self._disconnect_future = loop.create_future()
         self.last_telemetry_at = time.monotonic()
         self._monitor_task = asyncio.create_task(
-            self._monitor_loop(timeout, start_delay, check_interval),
+            self._monitor_loop(timeout, start_delay),
         )
         logger.info(
             f"ConnectionState: disconnect watch started (timeout={timeout}s, start_delay={start_delay}s)",
@@ -89,13 +95,12 @@ class ConnectionState:
         self,
         timeout: float,
         start_delay: float,
-        check_interval: float,
     ) -> None:
         try:
             await asyncio.sleep(start_delay)
             while not self.closed:
                 age = time.monotonic() - self.last_telemetry_at
-                if age > timeout:
+                if age >= timeout:
                     logger.error(f"Heartbeat lost (last telemetry {age:.1f}s ago)")
                     if self._on_disconnect is not None:
                         loop = asyncio.get_running_loop()
@@ -110,6 +115,8 @@ class ConnectionState:
                         with contextlib.suppress(asyncio.InvalidStateError):
                             self._disconnect_future.set_exception(err)
                     return
-                await asyncio.sleep(check_interval)
+                # Telemetry cannot go stale before last_telemetry_at + timeout,
+                # so wake exactly then rather than polling on a fixed interval.
+                await asyncio.sleep(timeout - age)
         except asyncio.CancelledError:
             return
@@ -16,6 +16,7 @@ from mavsdk.mavlink_direct import MavlinkMessage
 from mavsdk.offboard import OffboardError, PositionNedYaw, VelocityNedYaw
 from pymavlink import mavutil
 
+from aerpawlib.cli.progress_bar import update_progress
 from aerpawlib.v2.constants import (
     COPTER_GUIDED_MODE,
     COPTER_GUIDED_MODE_SWITCH_TIMEOUT_S,
@@ -142,8 +143,6 @@ class Drone(Vehicle):
             await asyncio.sleep(delay)  # Justified: min arm-to-takeoff delay
         if self._mission_start_time is None:
             self._mission_start_time = time.time()
-        from aerpawlib.cli.progress_bar import update_progress
-
         try:
             update_progress(state="Taking off")
             logger.debug(
@@ -153,6 +152,7 @@ class Drone(Vehicle):
             await self._system.action.takeoff()
             self._ready_to_move = lambda s: s.position.alt >= altitude * min_alt_tolerance
             last_log = 0.0
+            seq = None
             while not self.done_moving():
                 now = time.monotonic()
                 if now - last_log >= TAKEOFF_LOG_INTERVAL_S:
@@ -162,7 +162,7 @@ class Drone(Vehicle):
                         altitude,
                     )
                     last_log = now
-                await asyncio.sleep(POLLING_DELAY_S)
+                seq = await self._wait_for_position_update(TAKEOFF_LOG_INTERVAL_S, seq)
             await asyncio.sleep(
                 POST_TAKEOFF_STABILIZATION_S,
             )  # Justified: stabilization
@@ -193,8 +193,6 @@ class Drone(Vehicle):
         await self.await_ready_to_move()
         if self._event_log:
             self._event_log.log_event("land_start")
-        from aerpawlib.cli.progress_bar import update_progress
-
         try:
             update_progress(state="Landing")
             logger.debug("Drone: land sending land() command")
@@ -227,8 +225,6 @@ class Drone(Vehicle):
             raise RTLError("Home coordinates are not available for return_to_launch")
         if self._event_log:
             self._event_log.log_event("command", type="return_to_launch")
-        from aerpawlib.cli.progress_bar import update_progress
-
         try:
             update_progress(state="Returning home")
             logger.debug("Drone: return_to_launch navigating home then landing")
@@ -311,17 +307,15 @@ class Drone(Vehicle):
             raise NavigationError(str(e), original_error=e) from e
         finally:
             self._current_heading = None
-        self._ready_to_move = lambda s: coordinates.distance(s.position) <= tolerance
+        self._ready_to_move = lambda s: coordinates._distance_m(s.position) <= tolerance
 
         if blocking:
-            from aerpawlib.cli.progress_bar import update_progress
-
             try:
                 update_progress(state="Navigating")
                 await wait_for_blocking_goto(
                     self,
                     coordinates,
-                    distance_fn=lambda: coordinates.distance(self.position),
+                    distance_fn=lambda: coordinates._distance_m(self.position),
                     tolerance=tolerance,
                     timeout=timeout,
                     log_prefix="Drone",
@@ -356,7 +350,7 @@ class Drone(Vehicle):
         return start_nonblocking_goto(
             self,
             coordinates,
-            distance_fn=lambda: coordinates.distance(self.position),
+            distance_fn=lambda: coordinates._distance_m(self.position),
             tolerance=tolerance,
             timeout=timeout,
             on_cancel=_on_cancel,
@@ -34,9 +34,14 @@ async def wait_for_blocking_goto(
     timeout: float,
     log_prefix: str,
 ) -> None:
-    """Poll until the vehicle arrives at ``coordinates`` or times out."""
+    """Wait until the vehicle arrives at ``coordinates`` or times out.
+
+    Arrival is re-checked on each position sample rather than on a fixed
+    poll; without telemetry the loop still wakes for logging and timeout.
+    """
     start = time.monotonic()
     last_log = 0.0
+    seq = None
     while not vehicle.done_moving():
         elapsed = time.monotonic() - start
         if elapsed > timeout:
@@ -52,7 +57,10 @@ async def wait_for_blocking_goto(
                 elapsed,
             )
             last_log = now
-        await asyncio.sleep(POLLING_DELAY_S)
+        seq = await vehicle._wait_for_position_update(
+            max(POLLING_DELAY_S, min(GOTO_LOG_INTERVAL_S, timeout - elapsed)),
+            seq,
+        )
 
 
 def start_nonblocking_goto(
@@ -8,6 +8,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import math
 import time
 
 from mavsdk.action import ActionError
@@ -15,8 +16,10 @@ from mavsdk.mavlink_direct import MavlinkMessage
 from mavsdk.offboard import OffboardError, VelocityNedYaw
 from pymavlink import mavutil
 
+from aerpawlib.cli.progress_bar import update_progress
 from aerpawlib.v2.constants import (
     DEFAULT_GOTO_TIMEOUT_S,
+    EARTH_RADIUS_M,
     GOTO_POLL_INTERVAL_S,
     MAVLINK_MSG_COMMAND_LONG,
     OFFBOARD_STOP_SETTLE_DELAY_S,
@@ -166,17 +169,31 @@ class Rover(Vehicle):
             logger.error(f"Rover: goto_coordinates failed (ActionError): {e}")
             raise NavigationError(str(e), original_error=e) from e
 
-        self._ready_to_move = lambda s: coordinates.ground_distance(s.position) <= tolerance
+        # Haversine against the raw telemetry floats so the arrival polls
+        # build no Coordinate; same formula as Coordinate.ground_distance.
+        state = self._state
+        tgt_lat = coordinates.lat
+        tgt_lon = coordinates.lon
+        cos_tgt_lat = math.cos(math.radians(tgt_lat))
 
-        if blocking:
-            from aerpawlib.cli.progress_bar import update_progress
+        def _ground_distance_m() -> float:
+            lat = state._position_lat
+            dlat = math.radians(lat - tgt_lat)
+            dlon = math.radians(state._position_lon - tgt_lon)
+            a = math.sin(dlat / 2) ** 2 + cos_tgt_lat * math.cos(math.radians(lat)) * math.sin(dlon / 2) ** 2
+            sqrt_a = math.sqrt(a)
+            c = 2 * math.asin(sqrt_a) if sqrt_a < 1 else math.pi
+            return EARTH_RADIUS_M * c
+
+        self._ready_to_move = lambda _: _ground_distance_m() <= tolerance
 
+        if blocking:
             try:
                 update_progress(state="Navigating")
                 await wait_for_blocking_goto(
                     self,
                     coordinates,
-                    distance_fn=lambda: coordinates.ground_distance(self.position),
+                    distance_fn=_ground_distance_m,
                     tolerance=tolerance,
                     timeout=timeout,
                     log_prefix="Rover",
@@ -198,7 +215,7 @@ class Rover(Vehicle):
         return start_nonblocking_goto(
             self,
             coordinates,
-            distance_fn=lambda: coordinates.ground_distance(self.position),
+            distance_fn=_ground_distance_m,
             tolerance=tolerance,
             timeout=timeout,
             on_cancel=_on_cancel,
@@ -6,6 +6,7 @@ Plain attributes updated by telemetry (no ThreadSafeValue).
 
 from __future__ import annotations
 
+import asyncio
 import math
 import time
 
@@ -32,6 +33,11 @@ class VehicleState:
         self._position_lon: float = 0.0
         self._position_alt: float = 0.0
         self._position_abs_alt: float = 0.0
+        # Bumped on every position sample. Movement waits block on
+        # _position_event, which is set and replaced per sample so every
+        # waiter wakes and none has to clear it.
+        self._position_seq: int = 0
+        self._position_event: asyncio.Event = asyncio.Event()
         # Velocity
         self._velocity_ned: VectorNED = VectorNED(0, 0, 0)
         # Attitude / heading
@@ -137,6 +143,9 @@ class VehicleState:
         self._position_lon = lon
         self._position_alt = rel_alt
         self._position_abs_alt = abs_alt
+        self._position_seq += 1
+        event, self._position_event = self._position_event, asyncio.Event()
+        event.set()
 
     def update_attitude(self, roll: float, pitch: float, yaw: float) -> None:
         """Update attitude and derive heading from yaw.
@@ -19,7 +19,9 @@ class VehicleTask:
     """
 
     def __init__(self) -> None:
-        self._done = asyncio.Event()
+        self._done = False
+        # Only allocated if someone waits before completion.
+        self._done_event: asyncio.Event | None = None
         self._cancelled = False
         self._progress: float = 0.0
         self._error: Exception | None = None
@@ -33,30 +35,35 @@ class VehicleTask:
 
     def is_done(self) -> bool:
         """True if the command has completed (success, error, or cancelled)."""
-        return self._done.is_set()
+        return self._done
 
     def set_progress(self, value: float) -> None:
         """Update progress (0.0-1.0). Internal use by command implementation."""
         self._progress = max(0.0, min(1.0, value))
 
+    def _set_done(self) -> None:
+        self._done = True
+        if self._done_event is not None:
+            self._done_event.set()
+
     def set_complete(self) -> None:
         """Mark command as successfully complete. Internal use."""
         self._error = None
-        self._done.set()
+        self._set_done()
 
     def set_error(self, error: Exception) -> None:
         """Mark command as failed with error. Internal use."""
         self._error = error
-        self._done.set()
+        self._set_done()
 
     def set_on_cancel(self, callback: Callable[[], object]) -> None:
         """Set async callback to run when cancel() is called (e.g. RTL to stop goto)."""
         self._on_cancel = callback
 
     def _signal_cancelled(self) -> None:
-        if not self._done.is_set():
+        if not self._done:
             self._error = TaskCancelledError()
-            self._done.set()
+            self._set_done()
 
     def cancel(self) -> None:
         """Request cancellation. Invokes on_cancel callback
@@ -108,7 +115,10 @@ class VehicleTask:
         if self._cancel_tasks:
             await asyncio.gather(*self._cancel_tasks, return_exceptions=True)
             self._cancel_tasks.clear()
-        await self._done.wait()
+        if not self._done:
+            if self._done_event is None:
+                self._done_event = asyncio.Event()
+            await self._done_event.wait()
         if self._cancelled and self._error is None:
             raise TaskCancelledError()
         if self._error is not None:
@@ -13,7 +13,7 @@ target_ip = "127.0.0.1"
 
 
 class LeaderRunner(ZmqStateMachine):
-    _ping_regex = re.compile(r".+icmp_seq=(?P<seq>\d+).+time=(?P<time>\d\.\d+) ms")
+    _ping_regex = re.compile(r".+icmp_seq=(?P<seq>\d+).+time=(?P<time>\d+(?:\.\d+)?) ms")
 
     async def _ping_latency(self, address: str, count: int):
         """
@@ -24,17 +24,15 @@ class LeaderRunner(ZmqStateMachine):
         ping = ExternalProcess("ping", params=["-c", str(count), address])
         await ping.start()
         latencies = []
-        # repeatedly wait for ping to produce output w/ icmp_seq field
-        buff = 1
-        while buff:
-            buff = await ping.wait_until_output(r"icmp_seq=")
-            if not buff:
-                break
-            ping_re_match = self._ping_regex.match(buff[-1])
+        match = self._ping_regex.match
+        last_seq = str(count)
+        async for line in ping.read_lines():
+            ping_re_match = match(line)
             if ping_re_match is None:
                 continue
-            latencies.append(float(ping_re_match.group("time")))
-            if ping_re_match.group("seq") == str(count):
+            seq, latency = ping_re_match.group("seq", "time")
+            latencies.append(float(latency))
+            if seq == last_seq:
                 break
         if not latencies:
             raise RuntimeError(
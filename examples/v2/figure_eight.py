@@ -54,30 +54,33 @@ class FigureEight(BasicRunner):
 
     def _generate_figure_8_waypoints(self, center: Coordinate) -> list[Coordinate]:
         """Generate waypoints for a figure-8 pattern."""
-        waypoints = []
+        # Both loops use the same angles with the sign flipped for the second,
+        # so compute each (cos, sin) pair once.
+        angles = [(2 * math.pi * i) / self._waypoints_per_loop for i in range(self._waypoints_per_loop)]
+        unit_circle = [(math.cos(angle), math.sin(angle)) for angle in angles]
 
         # First loop (north of center)
         loop1_center = center + VectorNED(self._radius, 0, 0)
-        for i in range(self._waypoints_per_loop):
-            angle = (2 * math.pi * i) / self._waypoints_per_loop
-            offset = VectorNED(
-                self._radius * math.cos(angle),
-                self._radius * math.sin(angle),
+        waypoints = loop1_center.offset_many(
+            VectorNED(
+                self._radius * cos_a,
+                self._radius * sin_a,
                 0,
             )
-            waypoints.append(loop1_center + offset)
+            for cos_a, sin_a in unit_circle
+        )
 
-        # Second loop (south of center, traced in opposite direction)
+        # Second loop (south of center, traced in opposite direction);
+        # cos(-a) == cos(a) and sin(-a) == -sin(a)
         loop2_center = center + VectorNED(-self._radius, 0, 0)
-        for i in range(self._waypoints_per_loop):
-            # Reverse direction for second loop
-            angle = -(2 * math.pi * i) / self._waypoints_per_loop
-            offset = VectorNED(
-                self._radius * math.cos(angle),
-                self._radius * math.sin(angle),
+        waypoints += loop2_center.offset_many(
+            VectorNED(
+                self._radius * cos_a,
+                -self._radius * sin_a,
                 0,
             )
-            waypoints.append(loop2_center + offset)
+            for cos_a, sin_a in unit_circle
+        )
 
         return waypoints
 
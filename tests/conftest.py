@@ -13,17 +13,23 @@ import errno
 import json
 import logging
 import os
+import signal
 import socket
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 import pytest_asyncio
 
+from aerpawlib.v1.exceptions import ConnectionTimeoutError as ConnectionTimeoutErrorV1
 from aerpawlib.v1.log import LogComponent, LogLevel, configure_logging, get_logger
+from aerpawlib.v1.util import Coordinate, VectorNED
+from aerpawlib.v1.vehicle import Drone as DroneV1
+from aerpawlib.v1.vehicle import Rover as RoverV1
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -42,8 +48,17 @@ DEFAULT_SITL_INSTANCE_ROVER = 1  # Uses TCP 5770-5779
 # MAVSDK server ports - each vehicle needs its own gRPC port to avoid conflicts
 DEFAULT_MAVSDK_SERVER_PORT_DRONE = 50051
 DEFAULT_MAVSDK_SERVER_PORT_ROVER = 50052
+# Under pytest-xdist, worker N shifts the instance IDs and MAVSDK server ports
+# above by N * stride so each worker runs its own drone and rover SITL
+XDIST_WORKER_STRIDE = 2
 SITL_STARTUP_TIMEOUT = 90
+SITL_STARTUP_POLL_INTERVAL = 0.1  # pause between 0.5 s receive probes
+SITL_STOP_TIMEOUT = 5
+SITL_DEFAULT_SPEEDUP = 5  # override with SIM_SPEEDUP
 SITL_GPS_TIMEOUT = 120
+SITL_POLL_INTERVAL = 0.2  # telemetry is cached locally, so polling is cheap
+SITL_RESET_SETTLE_TIMEOUT = 2.0
+SITL_RESET_STEP_TIMEOUT = 2.0
 LAKE_WHEELER_LAT = 35.727436
 LAKE_WHEELER_LON = -78.696587
 
@@ -85,8 +100,13 @@ def can_receive_udp_packets(host: str, port: int, timeout: float = 0.5) -> bool:
             return False
 
 
+@lru_cache(maxsize=1)
 def _find_sim_vehicle() -> Path | None:
-    """Locate sim_vehicle.py from ARDUPILOT_HOME or common paths."""
+    """Locate sim_vehicle.py from ARDUPILOT_HOME or common paths.
+
+    The result is cached for the session; call ``_find_sim_vehicle.cache_clear()``
+    after changing ARDUPILOT_HOME.
+    """
     project_root = Path(__file__).resolve().parent.parent
     # Check for both 'ardupilot' and versioned directories like 'ardupilot-4.6.3'
     ardupilot_dirs = list(project_root.glob("ardupilot*"))
@@ -177,24 +197,18 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
 @pytest.fixture
 def origin_coordinate():
     """Coordinate at AERPAW Lake Wheeler."""
-    from aerpawlib.v1.util import Coordinate
-
     return Coordinate(LAKE_WHEELER_LAT, LAKE_WHEELER_LON, 0)
 
 
 @pytest.fixture
 def nearby_coordinate():
     """Coordinate ~100m north of origin."""
-    from aerpawlib.v1.util import Coordinate
-
     return Coordinate(LAKE_WHEELER_LAT + 0.0009, LAKE_WHEELER_LON, 0)
 
 
 @pytest.fixture
 def zero_vector():
     """Zero VectorNED."""
-    from aerpawlib.v1.util import VectorNED
-
     return VectorNED(0, 0, 0)
 
 
@@ -238,7 +252,7 @@ class SITLManager:
 
         env = os.environ.copy()
         env["ARDUPILOT_HOME"] = str(ardupilot_home)
-        env.setdefault("SIM_SPEEDUP", "2")
+        env.setdefault("SIM_SPEEDUP", str(SITL_DEFAULT_SPEEDUP))
         # Prevent sim_vehicle's run_in_terminal_window.sh from opening a new Terminal
         # window in GUI environments
         env.pop("DISPLAY", None)
@@ -260,6 +274,8 @@ class SITLManager:
 
         # Capture SITL output to a per-vehicle log file for debugging
         log_suffix = "drone" if self.vehicle_type == "ArduCopter" else "rover"
+        if worker := os.environ.get("PYTEST_XDIST_WORKER"):
+            log_suffix = f"{log_suffix}_{worker}"
         sitl_log_path = Path(f"logs/sitl_{log_suffix}_output.log")
         sitl_log_path.parent.mkdir(exist_ok=True)
         self._sitl_log = sitl_log_path.open("w")
@@ -271,6 +287,8 @@ class SITLManager:
             env=env,
             stdout=self._sitl_log,
             stderr=subprocess.STDOUT,
+            # Own process group so stop() also reaches MAVProxy and the SITL binary
+            start_new_session=True,
         )
 
         logger.debug(f"SITL process PID: {self._process.pid}")
@@ -295,7 +313,7 @@ class SITLManager:
                 logger.error(msg)
                 pytest.fail(msg)
 
-            time.sleep(1)
+            time.sleep(SITL_STARTUP_POLL_INTERVAL)
 
         self.stop()
         msg = f"SITL failed to start within {SITL_STARTUP_TIMEOUT}s. Check {sitl_log_path} (sim_vehicle output) and {sitl_process_log} (SITL process)."
@@ -306,36 +324,55 @@ class SITLManager:
         """Stop SITL process."""
         if self._process is not None:
             logger.info("Stopping SITL...")
+            self._signal_group(signal.SIGTERM)
             try:
-                self._process.terminate()
-                self._process.wait(timeout=10)
+                self._process.wait(timeout=SITL_STOP_TIMEOUT)
             except subprocess.TimeoutExpired:
                 logger.warning("SITL didn't terminate, killing...")
-                self._process.kill()
+            # The leader may exit while MAVProxy or the SITL binary ignores
+            # SIGTERM and keeps its ports; always finish off the whole group.
+            self._signal_group(signal.SIGKILL)
+            self._process.wait()
             self._process = None
             if hasattr(self, "_sitl_log"):
                 self._sitl_log.close()
             logger.info("SITL Stopped")
 
+    def _signal_group(self, sig: signal.Signals) -> None:
+        """Send *sig* to every process in SITL's process group."""
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(self._process.pid, sig)
+
     def connection_string(self) -> str:
         """Return MAVLink connection string."""
         return f"udpin://127.0.0.1:{self.port}"
 
 
+def _xdist_worker_index() -> int:
+    """Index of the current pytest-xdist worker ("gw3" -> 3), or 0 without xdist."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker.removeprefix("gw") or 0)
+
+
+def _worker_offset(value: int) -> int:
+    """Shift a per-vehicle instance ID or port so each xdist worker gets its own."""
+    return value + XDIST_WORKER_STRIDE * _xdist_worker_index()
+
+
 def _get_sitl_instance_drone(config) -> int:
     """Resolve drone SITL instance ID: --instance-drone or --instance or default."""
     inst_opt = config.getoption("--instance-drone", default=None)
     if inst_opt is not None:
-        return int(inst_opt)
-    return int(config.getoption("--instance", default=DEFAULT_SITL_INSTANCE_DRONE))
+        return _worker_offset(int(inst_opt))
+    return _worker_offset(int(config.getoption("--instance", default=DEFAULT_SITL_INSTANCE_DRONE)))
 
 
 def _get_sitl_instance_rover(config) -> int:
     """Resolve rover SITL instance ID: --instance-rover or default."""
     inst_opt = config.getoption("--instance-rover", default=None)
     if inst_opt is not None:
-        return int(inst_opt)
-    return DEFAULT_SITL_INSTANCE_ROVER
+        return _worker_offset(int(inst_opt))
+    return _worker_offset(DEFAULT_SITL_INSTANCE_ROVER)
 
 
 # Session-scoped SITL: started once per vehicle type, shared across integration tests
@@ -390,105 +427,99 @@ def sitl_connection_string_rover(sitl_manager_rover: SITLManager) -> str:
 # Full SITL reset (between each integration test)
 
 
-async def _full_sitl_reset(vehicle) -> None:
-    """Disarm, clear mission, battery reset. Full clean state between tests (v1)."""
+# long BATTERY_RESET 1 100
+_BATTERY_RESET_FIELDS_JSON = json.dumps(
+    {
+        "target_system": 1,
+        "target_component": 1,
+        "command": 42651,
+        "confirmation": 0,
+        "param1": 1.0,
+        "param2": 100.0,
+        "param3": 0.0,
+        "param4": 0.0,
+        "param5": 0.0,
+        "param6": 0.0,
+        "param7": 0.0,
+    }
+)
+
+
+def _battery_reset_message():
+    """COMMAND_LONG that resets the simulated battery to 100%."""
     from mavsdk.mavlink_direct import MavlinkMessage
 
+    return MavlinkMessage(
+        system_id=1,
+        component_id=1,
+        target_system_id=1,
+        target_component_id=1,
+        message_name="COMMAND_LONG",
+        fields_json=_BATTERY_RESET_FIELDS_JSON,
+    )
+
+
+async def _wait_for_disarm(vehicle, timeout: float = SITL_RESET_SETTLE_TIMEOUT) -> None:
+    """Wait until telemetry reports the vehicle disarmed, or until *timeout*."""
+    deadline = time.monotonic() + timeout
+    while vehicle.armed and time.monotonic() < deadline:
+        await asyncio.sleep(SITL_POLL_INTERVAL)
+
+
+async def _full_sitl_reset(vehicle) -> None:
+    """Disarm, clear mission, battery reset. Full clean state between tests (v1)."""
     system = getattr(vehicle, "_system", None)
     if not system:
         return
 
     async def _reset():
-        with contextlib.suppress(Exception):
-            await system.mission.clear_mission()
-        with contextlib.suppress(Exception):
-            await system.geofence.clear_geofence()
+        # Independent requests; errors are ignored like the steps below
+        await asyncio.gather(
+            system.mission.clear_mission(),
+            system.geofence.clear_geofence(),
+            return_exceptions=True,
+        )
         try:
             await system.action.return_to_launch()
             await asyncio.sleep(2)
         except Exception:
             pass
-        try:
-            # long BATTERY_RESET 1 100
-            fields = {
-                "target_system": 1,
-                "target_component": 1,
-                "command": 42651,
-                "confirmation": 0,
-                "param1": 1.0,
-                "param2": 100.0,
-                "param3": 0.0,
-                "param4": 0.0,
-                "param5": 0.0,
-                "param6": 0.0,
-                "param7": 0.0,
-            }
-            msg = MavlinkMessage(
-                system_id=1,
-                component_id=1,
-                target_system_id=1,
-                target_component_id=1,
-                message_name="COMMAND_LONG",
-                fields_json=json.dumps(fields),
-            )
-            await system.mavlink_direct.send_message(msg)
-        except Exception:
-            pass
         with contextlib.suppress(Exception):
-            await system.action.disarm()
+            await system.mavlink_direct.send_message(_battery_reset_message())
+        if vehicle.armed:
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(system.action.disarm(), SITL_RESET_STEP_TIMEOUT)
 
     try:
         await vehicle._run_on_mavsdk_loop(_reset())
-        await asyncio.sleep(2)
+        await _wait_for_disarm(vehicle)
     except Exception:
         pass
 
 
 async def _full_sitl_reset_v2(vehicle) -> None:
     """Full SITL reset for v2 vehicles (direct await, no _run_on_mavsdk_loop)."""
-    from mavsdk.mavlink_direct import MavlinkMessage
-
     system = getattr(vehicle, "_system", None)
     if not system:
         return
 
-    with contextlib.suppress(Exception):
-        await system.mission.clear_mission()
-    with contextlib.suppress(Exception):
-        await system.geofence.clear_geofence()
+    # Independent requests; errors are ignored like the steps below
+    await asyncio.gather(
+        system.mission.clear_mission(),
+        system.geofence.clear_geofence(),
+        return_exceptions=True,
+    )
     try:
         await system.action.return_to_launch()
         await asyncio.sleep(2)
     except Exception:
         pass
-    try:
-        fields = {
-            "target_system": 1,
-            "target_component": 1,
-            "command": 42651,
-            "confirmation": 0,
-            "param1": 1.0,
-            "param2": 100.0,
-            "param3": 0.0,
-            "param4": 0.0,
-            "param5": 0.0,
-            "param6": 0.0,
-            "param7": 0.0,
-        }
-        msg = MavlinkMessage(
-            system_id=1,
-            component_id=1,
-            target_system_id=1,
-            target_component_id=1,
-            message_name="COMMAND_LONG",
-            fields_json=json.dumps(fields),
-        )
-        await system.mavlink_direct.send_message(msg)
-    except Exception:
-        pass
     with contextlib.suppress(Exception):
-        await system.action.disarm()
-    await asyncio.sleep(2)
+        await system.mavlink_direct.send_message(_battery_reset_message())
+    if vehicle.armed:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(system.action.disarm(), SITL_RESET_STEP_TIMEOUT)
+    await _wait_for_disarm(vehicle)
 
 
 async def _connect_and_wait_gps(
@@ -506,15 +537,13 @@ async def _connect_and_wait_gps(
             Each vehicle instance should use a unique port to avoid conflicts.
         timeout: Timeout for GPS fix in seconds.
     """
-    from aerpawlib.v1.exceptions import ConnectionTimeoutError
-
     try:
         vehicle = await asyncio.to_thread(
             vehicle_class,
             connection_string,
             mavsdk_server_port=mavsdk_server_port,
         )
-    except ConnectionTimeoutError:
+    except ConnectionTimeoutErrorV1:
         pytest.fail(f"Connection timeout to {connection_string}")
     except Exception as e:
         pytest.fail(f"Vehicle init failed: {type(e).__name__}: {e}")
@@ -524,7 +553,7 @@ async def _connect_and_wait_gps(
         fix = vehicle.gps.fix_type
         if fix >= 3 and getattr(vehicle, "ekf_ready", True):
             return vehicle
-        await asyncio.sleep(1)
+        await asyncio.sleep(SITL_POLL_INTERVAL)
 
     vehicle.close()
     pytest.fail(f"No 3D GPS fix and EKF ready within {timeout}s")
@@ -538,12 +567,10 @@ async def _connect_and_wait_gps(
 @pytest_asyncio.fixture
 async def connected_drone(sitl_connection_string_drone: str) -> AsyncGenerator:
     """Drone connected to SITL. Full reset before each test."""
-    from aerpawlib.v1.vehicle import Drone
-
     drone = await _connect_and_wait_gps(
-        Drone,
+        DroneV1,
         sitl_connection_string_drone,
-        mavsdk_server_port=DEFAULT_MAVSDK_SERVER_PORT_DRONE,
+        mavsdk_server_port=_worker_offset(DEFAULT_MAVSDK_SERVER_PORT_DRONE),
     )
     yield drone
     try:
@@ -555,12 +582,10 @@ async def connected_drone(sitl_connection_string_drone: str) -> AsyncGenerator:
 @pytest_asyncio.fixture
 async def connected_rover(sitl_connection_string_rover: str) -> AsyncGenerator:
     """Rover connected to SITL. Full reset before each test."""
-    from aerpawlib.v1.vehicle import Rover
-
     rover = await _connect_and_wait_gps(
-        Rover,
+        RoverV1,
         sitl_connection_string_rover,
-        mavsdk_server_port=DEFAULT_MAVSDK_SERVER_PORT_ROVER,
+        mavsdk_server_port=_worker_offset(DEFAULT_MAVSDK_SERVER_PORT_ROVER),
     )
     yield rover
     try:
@@ -594,7 +619,7 @@ async def _connect_and_wait_gps_v2(
         fix = vehicle.gps.fix_type
         if fix >= 3 and getattr(vehicle, "ekf_ready", True):
             return vehicle
-        await asyncio.sleep(1)
+        await asyncio.sleep(SITL_POLL_INTERVAL)
 
     await vehicle.aclose()
     pytest.fail(f"No 3D GPS fix and EKF ready within {timeout}s")
@@ -608,7 +633,7 @@ async def connected_drone_v2(sitl_connection_string_drone: str) -> AsyncGenerato
     drone = await _connect_and_wait_gps_v2(
         Drone,
         sitl_connection_string_drone,
-        mavsdk_server_port=DEFAULT_MAVSDK_SERVER_PORT_DRONE,
+        mavsdk_server_port=_worker_offset(DEFAULT_MAVSDK_SERVER_PORT_DRONE),
     )
     yield drone
     try:
@@ -625,7 +650,7 @@ async def connected_rover_v2(sitl_connection_string_rover: str) -> AsyncGenerato
     rover = await _connect_and_wait_gps_v2(
         Rover,
         sitl_connection_string_rover,
-        mavsdk_server_port=DEFAULT_MAVSDK_SERVER_PORT_ROVER,
+        mavsdk_server_port=_worker_offset(DEFAULT_MAVSDK_SERVER_PORT_ROVER),
     )
     yield rover
     try:
@@ -48,6 +48,13 @@ class TestAerpawlibError:
         assert "caused by" in str(e)
         assert "inner" in str(e)
 
+    def test_str_reflects_reassigned_message(self):
+        e = AerpawlibError("first")
+        assert str(e) == "first"
+        e.message = "second"
+        e.original_error = ValueError("inner")
+        assert str(e) == "second (caused by: inner)"
+
 
 class TestConnectionErrors:
     """Connection-related exceptions."""
@@ -79,6 +79,17 @@ class TestExternalProcess:
         finally:
             await ep.aclose()
 
+    @pytest.mark.asyncio
+    async def test_read_lines_iterates_until_eof(self):
+        # v1 runs through the shell, so quote the escapes for printf
+        ep = ExternalProcess("printf", params=["'line1\\nline2\\nline3\\n'"])
+        await ep.start()
+        try:
+            lines = [line async for line in ep.read_lines()]
+            assert lines == ["line1", "line2", "line3"]
+        finally:
+            await ep.aclose()
+
     @pytest.mark.asyncio
     async def test_read_line_returns_none_on_eof(self):
         """After all output is drained and the process exits, read_line returns None."""
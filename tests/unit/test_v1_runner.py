@@ -400,6 +400,32 @@ class TestBackgroundTasks:
         # Should complete quickly (not hang on background task)
         await asyncio.wait_for(R().run(DummyVehicle()), timeout=2.0)
 
+    @pytest.mark.asyncio
+    async def test_background_cancelled_and_cleanup_when_state_raises(self):
+        """A failing state still cancels background tasks and runs cleanup()."""
+        events = []
+
+        class R(StateMachine):
+            @background
+            async def monitor(self, vehicle):
+                try:
+                    await asyncio.sleep(1000)
+                except asyncio.CancelledError:
+                    events.append("cancelled")
+                    raise
+
+            @state("boom", first=True)
+            async def boom_state(self, vehicle):
+                await asyncio.sleep(0)
+                raise RuntimeError("state failed")
+
+            def cleanup(self):
+                events.append("cleanup")
+
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(R().run(DummyVehicle()), timeout=2.0)
+        assert events == ["cancelled", "cleanup"]
+
 
 class TestAtInitTasks:
     @pytest.mark.asyncio
@@ -5,6 +5,8 @@ from aerpawlib.v1.safety import (
     deserialize_msg,
     serialize_request,
 )
+from aerpawlib.v1.safety.server import _polygon_bounds
+from aerpawlib.v1.util import Coordinate
 
 
 class _FakeSocket:
@@ -91,3 +93,45 @@ def test_start_server_unknown_function_request_does_not_crash():
     response = deserialize_msg(fake_socket.sent[0])
     assert response["result"] is False
     assert "not_implemented" in response["message"]
+
+
+def _square(lon0, lat0, size=0.01):
+    return [
+        {"lon": lon0, "lat": lat0},
+        {"lon": lon0 + size, "lat": lat0},
+        {"lon": lon0 + size, "lat": lat0 + size},
+        {"lon": lon0, "lat": lat0 + size},
+    ]
+
+
+def _waypoint_server(include, exclude):
+    server = SafetyCheckerServer.__new__(SafetyCheckerServer)
+    server.vehicle_type = "rover"
+    server.include_geofences = include
+    server.exclude_geofences = exclude
+    server._index_geofences()
+    return server
+
+
+def test_polygon_bounds():
+    assert _polygon_bounds(_square(-78.7, 35.7)) == pytest.approx((-78.7, 35.7, -78.69, 35.71))
+    min_lon, min_lat, max_lon, max_lat = _polygon_bounds([])
+    assert min_lon > max_lon and min_lat > max_lat
+
+
+def test_validate_waypoint_uses_matching_include_geofence():
+    server = _waypoint_server([_square(0.0, 0.0), _square(1.0, 1.0)], [_square(5.0, 5.0)])
+    ok, msg = server.validate_waypoint_command(Coordinate(1.002, 1.002), Coordinate(1.008, 1.008))
+    assert ok, msg
+    ok, msg = server.validate_waypoint_command(Coordinate(1.002, 1.002), Coordinate(2.0, 2.0))
+    assert not ok
+    assert "outside of the geofence" in msg
+
+
+def test_validate_waypoint_path_through_exclude_zone():
+    server = _waypoint_server([_square(0.0, 0.0, 1.0)], [_square(0.4, 0.4, 0.2), _square(0.8, 0.8, 0.1)])
+    ok, msg = server.validate_waypoint_command(Coordinate(0.1, 0.5), Coordinate(0.9, 0.5))
+    assert not ok
+    assert "enters no-go zone" in msg
+    ok, msg = server.validate_waypoint_command(Coordinate(0.1, 0.1), Coordinate(0.3, 0.3))
+    assert ok, msg
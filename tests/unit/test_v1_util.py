@@ -21,9 +21,12 @@ from aerpawlib.v1.util import (
     doIntersect,
     get_location_from_waypoint,
     inside,
+    inside_ray_edges,
     lies_on_segment,
     liesOnSegment,
     orientation,
+    polygon_edges,
+    polygon_ray_edges,
     read_from_plan,
     read_from_plan_complete,
     read_geofence,
@@ -151,6 +154,13 @@ class TestVectorNED:
         r = v.rotate_by_angle(90)
         assert abs(r.down - 5) < 1e-10
 
+    def test_rotate_many_matches_rotate_by_angle(self):
+        vectors = [VectorNED(1, 0, 0), VectorNED(3, -4, 2), VectorNED(-0.5, 7, -1)]
+        for angle in (0, 37.5, -90, 180):
+            got = [(r.north, r.east, r.down) for r in VectorNED.rotate_many(vectors, angle)]
+            want = [(r.north, r.east, r.down) for r in (v.rotate_by_angle(angle) for v in vectors)]
+            assert got == want
+
 
 class TestCoordinate:
     """Coordinate creation and operations."""
@@ -297,6 +307,16 @@ class TestCoordinate:
         r = c + VectorNED(0, 1000, 0)
         assert r.lon > c.lon
 
+    def test_offset_many_matches_add(self):
+        c = Coordinate(35.0, -78.0, 20.0)
+        vectors = [VectorNED(100, 0, 0), VectorNED(-30, 45, 5), VectorNED(0, -12.5, -3)]
+        got = [(r.lat, r.lon, r.alt) for r in c.offset_many(vectors)]
+        assert got == [((c + v).lat, (c + v).lon, (c + v).alt) for v in vectors]
+
+    def test_offset_many_invalid_type_raises(self):
+        with pytest.raises(TypeError):
+            Coordinate(0, 0, 0).offset_many([VectorNED(1, 0, 0), 5])
+
 
 class TestPlanFile:
     """Plan file reading."""
@@ -586,9 +606,72 @@ class TestGeofence:
         assert inside(5, 3, triangle) is True  # inside
         assert inside(0, 11, triangle) is False  # outside above apex
 
+    def test_inside_ray_through_vertex(self):
+        """A point level with a vertex is counted once, not twice."""
+        diamond = [
+            {"lon": 0, "lat": -1},
+            {"lon": 1, "lat": 0},
+            {"lon": 0, "lat": 1},
+            {"lon": -1, "lat": 0},
+        ]
+        assert inside(0.5, 0, diamond) is True
+        assert inside(-2, 0, diamond) is False
+        zigzag = [
+            {"lon": 0, "lat": 0},
+            {"lon": 4, "lat": 0},
+            {"lon": 4, "lat": 4},
+            {"lon": 3, "lat": 2},
+            {"lon": 2, "lat": 4},
+            {"lon": 1, "lat": 2},
+            {"lon": 0, "lat": 4},
+        ]
+        assert inside(0.5, 2, zigzag) is True
+        assert inside(2.5, 2, zigzag) is True
+        assert inside(1, 3, zigzag) is False
+
     def test_inside_empty_fence_returns_false(self):
         assert inside(0, 0, []) is False
 
+    def test_polygon_edges_wrap(self):
+        square = [{"lon": 0.0, "lat": 0.0}, {"lon": 1.0, "lat": 0.0}, {"lon": 1.0, "lat": 1.0}, {"lon": 0.0, "lat": 1.0}]
+        edges = polygon_edges(square)
+        assert edges == [(0.0, 0.0, 1.0, 0.0), (1.0, 0.0, 1.0, 1.0), (1.0, 1.0, 0.0, 1.0), (0.0, 1.0, 0.0, 0.0)]
+        assert polygon_edges([]) == []
+
+    def test_ray_edges_reused_across_points(self):
+        concave = [
+            {"lon": 0.0, "lat": 0.0},
+            {"lon": 10.0, "lat": 0.0},
+            {"lon": 10.0, "lat": 10.0},
+            {"lon": 5.0, "lat": 4.0},
+            {"lon": 0.0, "lat": 10.0},
+        ]
+        edges = polygon_ray_edges(concave)
+        assert len(edges) == 4  # the horizontal bottom edge is dropped
+        assert inside_ray_edges(5, 2, edges) is True
+        assert inside_ray_edges(1, 8, edges) is True
+        assert inside_ray_edges(5, 6, edges) is False  # in the notch
+        assert inside_ray_edges(11, 5, edges) is False
+        assert inside_ray_edges(1.0, 1.0, polygon_ray_edges([])) is False
+
+    def test_ray_edges_match_inside(self, square_geofence):
+        concave = [
+            {"lon": 0.0, "lat": 0.0},
+            {"lon": 10.0, "lat": 0.0},
+            {"lon": 10.0, "lat": 10.0},
+            {"lon": 5.0, "lat": 4.0},
+            {"lon": 0.0, "lat": 10.0},
+        ]
+        for fence in (concave, square_geofence):
+            edges = polygon_ray_edges(fence)
+            lons = [p["lon"] for p in fence]
+            lats = [p["lat"] for p in fence]
+            for i in range(-1, 12):
+                for k in range(-1, 12):
+                    lon = min(lons) + (max(lons) - min(lons)) * i / 10
+                    lat = min(lats) + (max(lats) - min(lats)) * k / 10
+                    assert inside_ray_edges(lon, lat, edges) == inside(lon, lat, fence)
+
 
 class TestReadGeofence:
     """read_geofence from KML."""
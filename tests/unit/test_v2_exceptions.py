@@ -43,6 +43,8 @@ class TestConnectionExceptions:
     def test_heartbeat_lost(self):
         e = HeartbeatLostError(5.2)
         assert "5.2" in str(e)
+        assert e.severity == "critical"
+        assert HeartbeatLostError(1.0, severity="warning").severity == "warning"
 
 
 class TestCommandExceptions:
@@ -69,6 +71,15 @@ class TestCommandExceptions:
         e = ArmError("prearm failed")
         assert "arm" in str(e).lower()
 
+    def test_default_severity(self):
+        assert ArmError().severity == "error"
+
+    def test_class_level_code(self):
+        assert ArmError().code == "ARM_ERROR"
+        assert TakeoffError().code == TakeoffError.code
+        assert ArmError(code="CUSTOM").code == "CUSTOM"
+        assert ArmError.code == "ARM_ERROR"
+
 
 class TestRunnerExceptions:
     """Runner/state machine exceptions."""
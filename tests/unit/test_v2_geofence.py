@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from aerpawlib.v2.geofence import do_intersect, inside, polygon_edges, read_geofence
+from aerpawlib.v2.geofence import do_intersect, inside, points_inside, polygon_edges, read_geofence
 
 
 class TestInside:
@@ -40,6 +40,50 @@ class TestInside:
         assert inside(5, 3, triangle) is True
         assert inside(0, 11, triangle) is False
 
+    def test_inside_ray_through_vertex(self):
+        """A point level with a vertex is counted once, not twice."""
+        diamond = [
+            {"lon": 0, "lat": -1},
+            {"lon": 1, "lat": 0},
+            {"lon": 0, "lat": 1},
+            {"lon": -1, "lat": 0},
+        ]
+        assert inside(0.5, 0, diamond) is True
+        assert inside(-2, 0, diamond) is False
+        zigzag = [
+            {"lon": 0, "lat": 0},
+            {"lon": 4, "lat": 0},
+            {"lon": 4, "lat": 4},
+            {"lon": 3, "lat": 2},
+            {"lon": 2, "lat": 4},
+            {"lon": 1, "lat": 2},
+            {"lon": 0, "lat": 4},
+        ]
+        assert inside(0.5, 2, zigzag) is True
+        assert inside(2.5, 2, zigzag) is True
+        assert inside(1, 3, zigzag) is False
+
+
+class TestPointsInside:
+    """points_inside(points, geofence) batch point-in-polygon."""
+
+    def test_matches_inside(self):
+        concave = [
+            {"lon": 0, "lat": 0},
+            {"lon": 10, "lat": 0},
+            {"lon": 10, "lat": 10},
+            {"lon": 5, "lat": 4},
+            {"lon": 0, "lat": 10},
+        ]
+        points = [(x * 0.5, y * 0.5) for x in range(-2, 23) for y in range(-2, 23)]
+        assert points_inside(points, concave) == [inside(lon, lat, concave) for lon, lat in points]
+
+    def test_empty_geofence(self):
+        assert points_inside([(0, 0), (1, 1)], []) == [False, False]
+
+    def test_no_points(self):
+        assert points_inside([], [{"lon": 0, "lat": 0}, {"lon": 1, "lat": 0}, {"lon": 0, "lat": 1}]) == []
+
 
 class TestDoIntersect:
     """do_intersect segment-segment intersection."""
@@ -28,6 +28,10 @@ class _NavVehicle:
     def done_moving(self) -> bool:
         return not self._moving
 
+    async def _wait_for_position_update(self, timeout: float, seen: int | None = None) -> int:
+        await asyncio.sleep(min(timeout, 0.01))
+        return 0
+
 
 @pytest.mark.asyncio
 async def test_wait_for_blocking_goto_completes_when_done():
@@ -1,6 +1,7 @@
 """Unit tests for aerpawlib v2 BasicRunner, StateMachine, and ZmqStateMachine."""
 
 import asyncio
+import time
 
 import pytest
 
@@ -110,6 +111,27 @@ class TestStateMachine:
         await SM().run(MockVehicle())
         assert "t" in order
 
+    @pytest.mark.asyncio
+    async def test_timed_state_holds_for_duration(self):
+        order = []
+
+        class SM(StateMachine):
+            @timed_state(name="t", duration=0.1, first=True)
+            async def t(self, vehicle):
+                order.append("t")
+                return "u"
+
+            @timed_state(name="u", duration=0.1, loop=True)
+            async def u(self, vehicle):
+                order.append("u")
+                return None
+
+        start = time.monotonic()
+        await SM().run(MockVehicle())
+        assert time.monotonic() - start >= 0.2
+        assert order.count("t") == 1
+        assert order.count("u") > 1
+
     @pytest.mark.asyncio
     async def test_background_task_starts(self):
         started = []
@@ -557,6 +579,34 @@ class TestDisconnectWatch:
         assert cfg.initial_state == "start"
         assert "battery" in cfg.exposed_fields
 
+    @pytest.mark.asyncio
+    async def test_field_request_replies_with_exposed_value(self):
+        calls = []
+
+        class Z(ZmqStateMachine):
+            @state(name="s", first=True)
+            async def s(self, vehicle):
+                return None
+
+            @expose_field_zmq("battery")
+            async def battery(self, vehicle):
+                calls.append(1)
+                return 87
+
+        z = Z()
+        replies = []
+
+        async def _capture(identifier, field, value):
+            replies.append((identifier, field, value))
+
+        z._zmq_send_reply = _capture
+        msg = {"msg_type": ZMQ_TYPE_FIELD_REQUEST, "from": "asker", "field": "battery"}
+        await z._zmq_handle_message(MockVehicle(), msg)
+        await z._zmq_handle_message(MockVehicle(), msg)
+        await z._zmq_handle_message(MockVehicle(), {**msg, "field": "unknown"})
+        assert replies == [("asker", "battery", 87), ("asker", "battery", 87), ("asker", "unknown", None)]
+        assert len(calls) == 2
+
     @pytest.mark.asyncio
     async def test_zmq_override_not_discarded_when_state_returns_none(self):
         """
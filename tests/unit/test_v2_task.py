@@ -23,6 +23,13 @@ class TestVehicleTask:
         task.set_complete()
         assert task.is_done() is True
 
+    @pytest.mark.asyncio
+    async def test_wait_done_wakes_on_later_completion(self):
+        task = VehicleTask()
+        asyncio.get_running_loop().call_later(0.02, task.set_complete)
+        await asyncio.wait_for(task.wait_done(), timeout=1.0)
+        assert task.is_done() is True
+
     @pytest.mark.asyncio
     async def test_wait_done_raises_on_error(self):
         task = VehicleTask()
@@ -1,5 +1,8 @@
 """Unit tests for aerpawlib v2 Coordinate and VectorNED."""
 
+import json
+import math
+
 import pytest
 
 from aerpawlib.v2.types import Coordinate, VectorNED
@@ -34,6 +37,11 @@ class TestVectorNED:
         assert abs(r.north - 0) < 1e-6
         assert abs(r.east - 1) < 1e-6
 
+    def test_rotate_many_matches_rotate_by_angle(self):
+        vectors = [VectorNED(1, 0, 0), VectorNED(3, -4, 2), VectorNED(-0.5, 7, -1)]
+        for angle in (0, 37.5, -90, 180):
+            assert VectorNED.rotate_many(vectors, angle) == [v.rotate_by_angle(angle) for v in vectors]
+
     def test_add(self):
         a = VectorNED(1, 2, 3)
         b = VectorNED(4, 5, 6)
@@ -90,6 +98,32 @@ class TestCoordinate:
         assert d.lat > c.lat
         assert abs(d.lon - c.lon) < 0.001
 
+    def test_ground_distance_antipodal(self):
+        half_circumference = math.pi * 6378137.0
+        assert Coordinate(0, 0).ground_distance(Coordinate(0, 180)) == pytest.approx(half_circumference)
+        assert Coordinate(90, 0).ground_distance(Coordinate(-90, 0)) == pytest.approx(half_circumference)
+
+    def test_to_json_matches_json_dumps(self):
+        cases = [
+            Coordinate(35.727123456789, -78.696, 10.25),
+            Coordinate(0, 0),
+            Coordinate(1e-7, -1e22, 0.1),
+            Coordinate(float("nan"), 0.0, 0.0),
+        ]
+        for c in cases:
+            assert c.to_json() == json.dumps({"lat": c.lat, "lon": c.lon, "alt": c.alt})
+        assert json.loads(cases[0].to_json()) == {"lat": 35.727123456789, "lon": -78.696, "alt": 10.25}
+
+    def test_offset_many_matches_add(self):
+        c = Coordinate(35.727, -78.696, 20)
+        vectors = [VectorNED(100, 0, 0), VectorNED(-30, 45, 5), VectorNED(0, -12.5, -3)]
+        assert c.offset_many(vectors) == [c + v for v in vectors]
+        assert c.offset_many([]) == []
+
+    def test_offset_many_type_error(self):
+        with pytest.raises(TypeError):
+            Coordinate(0, 0, 0).offset_many([VectorNED(1, 0, 0), 5])
+
     def test_bearing(self):
         a = Coordinate(35.727, -78.696, 0)
         b = Coordinate(35.728, -78.696, 0)
@@ -27,11 +27,30 @@ class TestConnectionState:
     async def test_watch_disconnect_fires_on_stale_telemetry(self):
         cs = ConnectionState(link_alive=True)
         cs.last_telemetry_at = 0.0
-        fut = cs.watch_disconnect(0.05, start_delay=0.0, check_interval=0.02)
+        fut = cs.watch_disconnect(0.05, start_delay=0.0)
         done, _ = await asyncio.wait([fut], timeout=2.0)
         assert fut in done
         assert isinstance(fut.exception(), HeartbeatLostError)
 
+    @pytest.mark.asyncio
+    async def test_watch_disconnect_tracks_fresh_telemetry(self):
+        cs = ConnectionState(link_alive=True)
+        fut = cs.watch_disconnect(0.2, start_delay=0.0)
+        for _ in range(4):
+            await asyncio.sleep(0.1)
+            cs.record_telemetry()
+        assert not fut.done()
+        done, _ = await asyncio.wait([fut], timeout=2.0)
+        assert fut in done
+        assert isinstance(fut.exception(), HeartbeatLostError)
+
+    @pytest.mark.asyncio
+    async def test_check_interval_is_deprecated(self):
+        cs = ConnectionState(link_alive=True)
+        with pytest.warns(DeprecationWarning, match="check_interval"):
+            cs.watch_disconnect(60.0, start_delay=0.0, check_interval=0.5)
+        cs.mark_closed()
+
     @pytest.mark.asyncio
     async def test_mark_closed_cancels_watch(self):
         cs = ConnectionState(link_alive=True)
@@ -93,3 +112,60 @@ class TestConnectionNormalization:
 
         v4 = Vehicle(mock_system, "tcp://127.0.0.1:5760")
         assert v4._connection_string == "tcp://127.0.0.1:5760"
+
+
+class TestVehicleStatePosition:
+    def test_position_is_independent_copy(self):
+        from aerpawlib.v2.vehicle.state import VehicleState
+
+        state = VehicleState()
+        state.update_position(35.7, -78.6, 10.0, 110.0)
+        p = state.position
+        assert (p.lat, p.lon, p.alt) == (35.7, -78.6, 10.0)
+        p.alt = 30.0
+        assert state.position is not p
+        assert state.position.alt == 10.0
+
+    def test_update_position_sets_event(self):
+        from aerpawlib.v2.vehicle.state import VehicleState
+
+        state = VehicleState()
+        event = state._position_event
+        seq = state._position_seq
+        state.update_position(35.7, -78.6, 10.0, 110.0)
+        assert event.is_set()
+        assert not state._position_event.is_set()
+        assert state._position_seq == seq + 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_position_update_wakes_on_sample(self):
+        v = DummyVehicle()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, v._state.update_position, 35.8, -78.7, 12.0, 112.0)
+        start = loop.time()
+        seq = await v._wait_for_position_update(5.0)
+        assert loop.time() - start < 1.0
+        assert seq == v._state._position_seq
+        assert v.position.alt == 12.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_position_update_wakes_every_waiter(self):
+        v = DummyVehicle()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, v._state.update_position, 35.8, -78.7, 12.0, 112.0)
+        start = loop.time()
+        await asyncio.gather(
+            v._wait_for_position_update(5.0),
+            v._wait_for_position_update(5.0),
+        )
+        assert loop.time() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_position_update_returns_on_missed_sample(self):
+        v = DummyVehicle()
+        seen = v._state._position_seq
+        v._state.update_position(35.8, -78.7, 12.0, 112.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await v._wait_for_position_update(5.0, seen) == seen + 1
+        assert loop.time() - start < 1.0